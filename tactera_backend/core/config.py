@@ -1,4 +1,5 @@
 import os
+from datetime import timedelta, timezone
 
 # =====================================
 # Global configuration for Tactera
@@ -11,3 +12,22 @@ import os
 #   - Enable admin/debug shortcuts
 #   - Relax validation rules for faster testing
 TEST_MODE = True
+
+# RANDOM_SEED:
+# Optional seed for the simulation RNGs (training XP, injuries, matches) so
+# test runs and replays are reproducible. Set TACTERA_RANDOM_SEED=<int>;
+# when unset, the RNGs are seeded from system entropy. Match simulations
+# combine it with the fixture id, so each fixture replays independently.
+RANDOM_SEED = int(os.environ["TACTERA_RANDOM_SEED"]) if os.getenv("TACTERA_RANDOM_SEED") else None
+
+# VERBOSE_INJURY_LOG:
+# Per-player injury-risk lines during match simulation (one line for every
+# player in every match). Off by default, even in TEST_MODE; injury events
+# and match summaries are still printed in TEST_MODE.
+# Set TACTERA_VERBOSE_INJURY_LOG=1 to enable.
+VERBOSE_INJURY_LOG = os.getenv("TACTERA_VERBOSE_INJURY_LOG") == "1"
+
+# UTC_PLUS_2:
+# The game's clock zone. Injury start dates are stored in UTC+2 and the
+# daily tick runs at UTC+2 midnight. Shared so no module rebuilds it.
+UTC_PLUS_2 = timezone(timedelta(hours=2))
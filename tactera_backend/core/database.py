@@ -1,8 +1,10 @@
 import os
+from contextlib import contextmanager
 from sqlmodel import SQLModel, Session
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine as create_sync_engine
+from sqlalchemy import create_engine as create_sync_engine, event
+from tactera_backend.core.config import TEST_MODE
 
 # --- Absolute database path ---
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -17,9 +19,32 @@ if not os.path.exists(DB_PATH):
 DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"    # Async engine (routes)
 SYNC_DATABASE_URL = f"sqlite:///{DB_PATH}"         # Sync engine (seeding/scripts)
 
-# --- Engines ---
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)        # Async
-sync_engine = create_sync_engine(SYNC_DATABASE_URL, echo=True, future=True)  # Sync
+# --- SQL logging ---
+# Echoing every statement is expensive; on by default only in TEST_MODE.
+# Override with SQL_ECHO=1 / SQL_ECHO=0.
+SQL_ECHO = os.getenv("SQL_ECHO", "1" if TEST_MODE else "0") == "1"
+
+# --- Engines (single module-level instances) ---
+engine = create_async_engine(
+    DATABASE_URL, echo=SQL_ECHO, future=True, pool_pre_ping=True,
+    connect_args={"check_same_thread": False}
+)  # Async
+sync_engine = create_sync_engine(
+    SYNC_DATABASE_URL, echo=SQL_ECHO, future=True, pool_pre_ping=True,
+    connect_args={"check_same_thread": False}
+)  # Sync
+
+# --- SQLite pragmas ---
+# WAL + synchronous=NORMAL: commits no longer fsync the main DB file every time,
+# and readers don't block the writer (async routes + sync seeding/finance).
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+event.listen(sync_engine, "connect", _set_sqlite_pragmas)
 
 # --- Async session maker ---
 async_session_maker = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
@@ -39,6 +64,27 @@ async def init_db():
 def get_sync_session():
     return Session(sync_engine)
 
+# --- Bulk-write session for seeding ---
+@contextmanager
+def bulk_write_session():
+    """
+    Sync session pinned to one connection with PRAGMA synchronous=OFF, for
+    large seeding writes (no fsync per commit). Seeding only: a crash mid-
+    write can lose the batch. The pragma is restored before the connection
+    goes back to the pool.
+    """
+    with sync_engine.connect() as conn:
+        # Set on the raw DBAPI connection: the pragma can't run inside a transaction
+        dbapi_connection = conn.connection.dbapi_connection
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+        try:
+            with Session(bind=conn) as session:
+                yield session
+        finally:
+            if conn.in_transaction():
+                conn.rollback()
+            dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+
 # --- Legacy sync session (for old routes) ---
 def get_session():
     with Session(sync_engine) as session:
@@ -1,35 +1,73 @@
 import random
-from typing import Dict
-from tactera_backend.core.injury_config import INJURY_SEVERITY, INJURY_LIST, INJURY_SEVERITY_WEIGHTS
+from itertools import accumulate
+from typing import Dict, List, Optional
+import numpy as np
+from tactera_backend.core.injury_config import (
+    INJURY_SEVERITY, INJURY_LIST, INJURY_SEVERITY_WEIGHTS, REINJURY_MULTIPLIER
+)
+from tactera_backend.core.config import RANDOM_SEED
 
-def generate_injury() -> Dict:
-    """
-    Generate a random injury with severity, duration, and rehab phase details.
-    """
-    severity = random.choices(
-        population=list(INJURY_SEVERITY_WEIGHTS.keys()),
-        weights=list(INJURY_SEVERITY_WEIGHTS.values()),
-        k=1
-    )[0]
+# Module-level RNG (seedable via TACTERA_RANDOM_SEED for reproducible runs)
+_rng = random.Random(RANDOM_SEED)
 
-    injury = random.choice(INJURY_LIST[severity])
-    duration_range = INJURY_SEVERITY[severity]
-    days_total = random.randint(duration_range["min_days"], duration_range["max_days"])
 
-    rehab_start = max(1, int(days_total * random.uniform(0.5, 0.7)))
-    rehab_xp_multiplier = 0.4 if severity in ["moderate", "severe"] else 0.6
+def _rehab_xp_multiplier(severity: str) -> float:
     if severity == "major":
-        rehab_xp_multiplier = 0.3
+        return 0.3
+    return 0.4 if severity in ["moderate", "severe"] else 0.6
+
 
-    return {
+# Flat injury catalog built once at import: one template per injury, with
+# the severity's duration range and rehab multiplier baked in. Each weight
+# is the severity weight split evenly across that severity's injuries, so
+# sampling a template directly matches "pick severity, then pick injury".
+INJURY_TEMPLATES: List[Dict] = [
+    {
         "name": injury["name"],
         "type": injury["type"],
         "severity": severity,
-        "days_total": days_total,
-        "rehab_start": rehab_start,
-        "rehab_xp_multiplier": rehab_xp_multiplier,
-        "fit_for_matches": False
+        "min_days": INJURY_SEVERITY[severity]["min_days"],
+        "max_days": INJURY_SEVERITY[severity]["max_days"],
+        "rehab_xp_multiplier": _rehab_xp_multiplier(severity),
     }
+    for severity, weight in INJURY_SEVERITY_WEIGHTS.items()
+    for injury in INJURY_LIST[severity]
+]
+INJURY_WEIGHTS: List[float] = [
+    weight / len(INJURY_LIST[severity])
+    for severity, weight in INJURY_SEVERITY_WEIGHTS.items()
+    for _ in INJURY_LIST[severity]
+]
+_INJURY_CUM_WEIGHTS = list(accumulate(INJURY_WEIGHTS))
+
+
+def generate_injuries(k: int, rng: Optional[random.Random] = None) -> List[Dict]:
+    """
+    Generate k random injuries in one weighted draw over INJURY_TEMPLATES.
+    Each result is a fresh dict (safe to mutate). Pass `rng` to draw from a
+    caller-owned RNG (e.g. a per-match one) instead of the module RNG.
+    """
+    rng = rng or _rng
+    injuries = []
+    for template in rng.choices(INJURY_TEMPLATES, cum_weights=_INJURY_CUM_WEIGHTS, k=k):
+        days_total = rng.randint(template["min_days"], template["max_days"])
+        injuries.append({
+            "name": template["name"],
+            "type": template["type"],
+            "severity": template["severity"],
+            "days_total": days_total,
+            "rehab_start": max(1, int(days_total * rng.uniform(0.5, 0.7))),
+            "rehab_xp_multiplier": template["rehab_xp_multiplier"],
+            "fit_for_matches": False
+        })
+    return injuries
+
+
+def generate_injury() -> Dict:
+    """
+    Generate a random injury with severity, duration, and rehab phase details.
+    """
+    return generate_injuries(1)[0]
 
 def calculate_injury_risk(base_risk: float, pitch_quality: int, energy: int, injury_proneness: float) -> float:
     """
@@ -38,6 +76,7 @@ def calculate_injury_risk(base_risk: float, pitch_quality: int, energy: int, inj
     - Pitch quality (lower pitch quality = higher risk)
     - Player energy (fatigue increases risk)
     - Injury proneness (hidden multiplier)
+    Element-wise, so energy/proneness may also be NumPy arrays (one risk per player).
     """
     # Pitch effect: bad pitch increases risk
     pitch_factor = 1 + ((100 - pitch_quality) / 100)
@@ -52,6 +91,28 @@ def calculate_injury_risk(base_risk: float, pitch_quality: int, energy: int, inj
     return base_risk * pitch_factor * energy_factor * proneness_factor
 
 
+def calculate_injury_risk_vec(
+    base_risk: float, pitch_quality: int, energy: np.ndarray, injury_proneness: np.ndarray, in_rehab: np.ndarray
+) -> np.ndarray:
+    """
+    Array kernel for a whole squad: same formula as calculate_injury_risk,
+    plus REINJURY_MULTIPLIER for players in their rehab phase (in_rehab mask).
+    Works in place on one float64 buffer, so no per-step temporaries.
+    """
+    # Match-wide scalar part: base risk * pitch factor
+    scale = base_risk * (1 + ((100 - pitch_quality) / 100))
+
+    # Energy factor 1 + (100 - energy) / 100 == 2 - energy / 100
+    risk = np.asarray(energy, dtype=np.float64) / -100
+    risk += 2
+    risk *= injury_proneness
+    risk *= scale
+
+    # Rehab-phase players carry the reinjury multiplier
+    risk[in_rehab] *= REINJURY_MULTIPLIER
+    return risk
+
+
 def calculate_fatigue_modifier(pitch_quality: int) -> float:
     """
     Better pitches reduce energy loss after a match.
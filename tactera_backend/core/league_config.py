@@ -11,293 +11,410 @@ Defines nations, leagues, and divisions for Tactera.
 - Dynamic reputation system prepared
 """
 
-league_config = {
-    # ==========================================
-    # 🇬🇧 ENGLAND - EXTENDED SYSTEM (ACTIVE)
-    # ==========================================
-    "England": {
-        "active": True,          # ✅ BETA ACTIVE
-        "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
-        "reputation": 92,        # Premier League - elite level (scale 1-100)
-        "leagues": [
-            {
-                "name": "Premier League",   # Tier 1
-                "level": 1,
-                "teams": 18
-            },
-            {
-                "name": "Division 2",       # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 18},  # Group 1
-                    {"teams": 18},  # Group 2
-                    {"teams": 18},  # Group 3
-                    {"teams": 18}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇩🇰 DENMARK - COMPACT SYSTEM (ACTIVE) 
-    # ==========================================
-    "Denmark": {
-        "active": True,          # ✅ BETA ACTIVE
-        "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
-        "reputation": 75,        # Superligaen - good level, smaller nation
-        "leagues": [
-            {
-                "name": "Superligaen",      # Tier 1
-                "level": 1,
-                "teams": 14
-            },
-            {
-                "name": "Division 2",       # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 14},  # Group 1
-                    {"teams": 14},  # Group 2
-                    {"teams": 14},  # Group 3
-                    {"teams": 14}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇩🇪 GERMANY - EXTENDED SYSTEM (INACTIVE)
-    # ==========================================
-    "Germany": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
-        "reputation": 95,        # Bundesliga - highest reputation
-        "leagues": [
-            {
-                "name": "Bundesliga",       # Tier 1
-                "level": 1,
-                "teams": 18
-            },
-            {
-                "name": "2. Bundesliga",    # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 18},  # Group 1
-                    {"teams": 18},  # Group 2
-                    {"teams": 18},  # Group 3
-                    {"teams": 18}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇪🇸 SPAIN - EXTENDED SYSTEM (INACTIVE)
-    # ==========================================
-    "Spain": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
-        "reputation": 94,        # La Liga - elite level
-        "leagues": [
-            {
-                "name": "La Liga",          # Tier 1
-                "level": 1,
-                "teams": 18
-            },
-            {
-                "name": "Segunda División", # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 18},  # Group 1
-                    {"teams": 18},  # Group 2
-                    {"teams": 18},  # Group 3
-                    {"teams": 18}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇮🇹 ITALY - EXTENDED SYSTEM (INACTIVE)
-    # ==========================================
-    "Italy": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
-        "reputation": 90,        # Serie A - strong reputation
-        "leagues": [
-            {
-                "name": "Serie A",          # Tier 1
-                "level": 1,
-                "teams": 18
-            },
-            {
-                "name": "Serie B",          # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 18},  # Group 1
-                    {"teams": 18},  # Group 2
-                    {"teams": 18},  # Group 3
-                    {"teams": 18}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇫🇷 FRANCE - EXTENDED SYSTEM (INACTIVE)
-    # ==========================================
-    "France": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
-        "reputation": 88,        # Ligue 1 - strong reputation
-        "leagues": [
-            {
-                "name": "Ligue 1",          # Tier 1
-                "level": 1,
-                "teams": 18
-            },
-            {
-                "name": "Ligue 2",          # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 18},  # Group 1
-                    {"teams": 18},  # Group 2
-                    {"teams": 18},  # Group 3
-                    {"teams": 18}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇳🇱 NETHERLANDS - EXTENDED SYSTEM (INACTIVE)
-    # ==========================================
-    "Netherlands": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
-        "reputation": 82,        # Eredivisie - good reputation
-        "leagues": [
-            {
-                "name": "Eredivisie",       # Tier 1
-                "level": 1,
-                "teams": 18
-            },
-            {
-                "name": "Eerste Divisie",   # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 18},  # Group 1
-                    {"teams": 18},  # Group 2
-                    {"teams": 18},  # Group 3
-                    {"teams": 18}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇵🇹 PORTUGAL - COMPACT SYSTEM (INACTIVE)
-    # ==========================================
-    "Portugal": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
-        "reputation": 78,        # Primeira Liga - decent reputation
-        "leagues": [
-            {
-                "name": "Primeira Liga",    # Tier 1
-                "level": 1,
-                "teams": 14
-            },
-            {
-                "name": "Liga 2",           # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 14},  # Group 1
-                    {"teams": 14},  # Group 2
-                    {"teams": 14},  # Group 3
-                    {"teams": 14}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇧🇪 BELGIUM - COMPACT SYSTEM (INACTIVE)
-    # ==========================================
-    "Belgium": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
-        "reputation": 74,        # Jupiler Pro League - decent level
-        "leagues": [
-            {
-                "name": "Jupiler Pro League", # Tier 1
-                "level": 1,
-                "teams": 14
-            },
-            {
-                "name": "Challenger Pro League", # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 14},  # Group 1
-                    {"teams": 14},  # Group 2
-                    {"teams": 14},  # Group 3
-                    {"teams": 14}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇸🇪 SWEDEN - COMPACT SYSTEM (INACTIVE)
-    # ==========================================
-    "Sweden": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
-        "reputation": 70,        # Allsvenskan - average level
-        "leagues": [
-            {
-                "name": "Allsvenskan",      # Tier 1
-                "level": 1,
-                "teams": 14
-            },
-            {
-                "name": "Superettan",       # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 14},  # Group 1
-                    {"teams": 14},  # Group 2
-                    {"teams": 14},  # Group 3
-                    {"teams": 14}   # Group 4
-                ]
-            }
-        ]
-    },
-
-    # ==========================================
-    # 🇳🇴 NORWAY - COMPACT SYSTEM (INACTIVE)
-    # ==========================================
-    "Norway": {
-        "active": False,         # 🚧 PREPARED FOR FUTURE
-        "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
-        "reputation": 68,        # Eliteserien - average level
-        "leagues": [
-            {
-                "name": "Eliteserien",      # Tier 1
-                "level": 1,
-                "teams": 14
-            },
-            {
-                "name": "1. divisjon",      # Tier 2 (grouped)
-                "level": 2,
-                "divisions": [
-                    {"teams": 14},  # Group 1
-                    {"teams": 14},  # Group 2
-                    {"teams": 14},  # Group 3
-                    {"teams": 14}   # Group 4
-                ]
-            }
-        ]
+from collections import namedtuple
+from functools import lru_cache
+
+
+def _build_league_config() -> dict:
+    """The full nation/league/division table (built on first use, see get_league_config)."""
+    config = {
+        # ==========================================
+        # 🇬🇧 ENGLAND - EXTENDED SYSTEM (ACTIVE)
+        # ==========================================
+        "England": {
+            "active": True,          # ✅ BETA ACTIVE
+            "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
+            "reputation": 92,        # Premier League - elite level (scale 1-100)
+            "leagues": [
+                {
+                    "name": "Premier League",   # Tier 1
+                    "level": 1,
+                    "teams": 18
+                },
+                {
+                    "name": "Division 2",       # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 18},  # Group 1
+                        {"teams": 18},  # Group 2
+                        {"teams": 18},  # Group 3
+                        {"teams": 18}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇩🇰 DENMARK - COMPACT SYSTEM (ACTIVE) 
+        # ==========================================
+        "Denmark": {
+            "active": True,          # ✅ BETA ACTIVE
+            "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
+            "reputation": 75,        # Superligaen - good level, smaller nation
+            "leagues": [
+                {
+                    "name": "Superligaen",      # Tier 1
+                    "level": 1,
+                    "teams": 14
+                },
+                {
+                    "name": "Division 2",       # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 14},  # Group 1
+                        {"teams": 14},  # Group 2
+                        {"teams": 14},  # Group 3
+                        {"teams": 14}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇩🇪 GERMANY - EXTENDED SYSTEM (INACTIVE)
+        # ==========================================
+        "Germany": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
+            "reputation": 95,        # Bundesliga - highest reputation
+            "leagues": [
+                {
+                    "name": "Bundesliga",       # Tier 1
+                    "level": 1,
+                    "teams": 18
+                },
+                {
+                    "name": "2. Bundesliga",    # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 18},  # Group 1
+                        {"teams": 18},  # Group 2
+                        {"teams": 18},  # Group 3
+                        {"teams": 18}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇪🇸 SPAIN - EXTENDED SYSTEM (INACTIVE)
+        # ==========================================
+        "Spain": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
+            "reputation": 94,        # La Liga - elite level
+            "leagues": [
+                {
+                    "name": "La Liga",          # Tier 1
+                    "level": 1,
+                    "teams": 18
+                },
+                {
+                    "name": "Segunda División", # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 18},  # Group 1
+                        {"teams": 18},  # Group 2
+                        {"teams": 18},  # Group 3
+                        {"teams": 18}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇮🇹 ITALY - EXTENDED SYSTEM (INACTIVE)
+        # ==========================================
+        "Italy": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
+            "reputation": 90,        # Serie A - strong reputation
+            "leagues": [
+                {
+                    "name": "Serie A",          # Tier 1
+                    "level": 1,
+                    "teams": 18
+                },
+                {
+                    "name": "Serie B",          # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 18},  # Group 1
+                        {"teams": 18},  # Group 2
+                        {"teams": 18},  # Group 3
+                        {"teams": 18}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇫🇷 FRANCE - EXTENDED SYSTEM (INACTIVE)
+        # ==========================================
+        "France": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
+            "reputation": 88,        # Ligue 1 - strong reputation
+            "leagues": [
+                {
+                    "name": "Ligue 1",          # Tier 1
+                    "level": 1,
+                    "teams": 18
+                },
+                {
+                    "name": "Ligue 2",          # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 18},  # Group 1
+                        {"teams": 18},  # Group 2
+                        {"teams": 18},  # Group 3
+                        {"teams": 18}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇳🇱 NETHERLANDS - EXTENDED SYSTEM (INACTIVE)
+        # ==========================================
+        "Netherlands": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "extended",    # 18 teams, 34 rounds, 16.7% relegation
+            "reputation": 82,        # Eredivisie - good reputation
+            "leagues": [
+                {
+                    "name": "Eredivisie",       # Tier 1
+                    "level": 1,
+                    "teams": 18
+                },
+                {
+                    "name": "Eerste Divisie",   # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 18},  # Group 1
+                        {"teams": 18},  # Group 2
+                        {"teams": 18},  # Group 3
+                        {"teams": 18}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇵🇹 PORTUGAL - COMPACT SYSTEM (INACTIVE)
+        # ==========================================
+        "Portugal": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
+            "reputation": 78,        # Primeira Liga - decent reputation
+            "leagues": [
+                {
+                    "name": "Primeira Liga",    # Tier 1
+                    "level": 1,
+                    "teams": 14
+                },
+                {
+                    "name": "Liga 2",           # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 14},  # Group 1
+                        {"teams": 14},  # Group 2
+                        {"teams": 14},  # Group 3
+                        {"teams": 14}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇧🇪 BELGIUM - COMPACT SYSTEM (INACTIVE)
+        # ==========================================
+        "Belgium": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
+            "reputation": 74,        # Jupiler Pro League - decent level
+            "leagues": [
+                {
+                    "name": "Jupiler Pro League", # Tier 1
+                    "level": 1,
+                    "teams": 14
+                },
+                {
+                    "name": "Challenger Pro League", # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 14},  # Group 1
+                        {"teams": 14},  # Group 2
+                        {"teams": 14},  # Group 3
+                        {"teams": 14}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇸🇪 SWEDEN - COMPACT SYSTEM (INACTIVE)
+        # ==========================================
+        "Sweden": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
+            "reputation": 70,        # Allsvenskan - average level
+            "leagues": [
+                {
+                    "name": "Allsvenskan",      # Tier 1
+                    "level": 1,
+                    "teams": 14
+                },
+                {
+                    "name": "Superettan",       # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 14},  # Group 1
+                        {"teams": 14},  # Group 2
+                        {"teams": 14},  # Group 3
+                        {"teams": 14}   # Group 4
+                    ]
+                }
+            ]
+        },
+
+        # ==========================================
+        # 🇳🇴 NORWAY - COMPACT SYSTEM (INACTIVE)
+        # ==========================================
+        "Norway": {
+            "active": False,         # 🚧 PREPARED FOR FUTURE
+            "system": "compact",     # 14 teams, 26 rounds, 21.4% relegation
+            "reputation": 68,        # Eliteserien - average level
+            "leagues": [
+                {
+                    "name": "Eliteserien",      # Tier 1
+                    "level": 1,
+                    "teams": 14
+                },
+                {
+                    "name": "1. divisjon",      # Tier 2 (grouped)
+                    "level": 2,
+                    "divisions": [
+                        {"teams": 14},  # Group 1
+                        {"teams": 14},  # Group 2
+                        {"teams": 14},  # Group 3
+                        {"teams": 14}   # Group 4
+                    ]
+                }
+            ]
+        }
+    }
+
+    # 🔢 Denormalized once per country: tier 1 teams + every tier 2 group
+    for country in config.values():
+        country["total_teams"] = country["leagues"][0]["teams"] + sum(
+            division["teams"] for division in country["leagues"][1]["divisions"]
+        )
+
+    return config
+
+
+@lru_cache(maxsize=1)
+def get_league_config() -> dict:
+    """Build league_config once, on first access, and return the cached dict."""
+    return _build_league_config()
+
+
+# ==========================================
+# ⚡ FLAT COUNTRY TABLE + DERIVED LOOKUPS
+# ==========================================
+# league_config stays the readable source of truth; COUNTRIES is a frozen,
+# flat view of it (one immutable record per country, in config order).
+# Like league_config itself, these are built lazily on first access.
+CountryConfig = namedtuple(
+    "CountryConfig",
+    "name active system reputation tier1_name tier1_teams tier2_name tier2_groups tier2_teams_per_group"
+)
+
+
+def _build_country(name: str, cfg: dict) -> CountryConfig:
+    tier1 = next(league for league in cfg["leagues"] if league["level"] == 1)
+    tier2 = next(league for league in cfg["leagues"] if league["level"] == 2)
+    return CountryConfig(
+        name=name,
+        active=cfg["active"],
+        system=cfg["system"],
+        reputation=cfg["reputation"],
+        tier1_name=tier1["name"],
+        tier1_teams=tier1["teams"],
+        tier2_name=tier2["name"],
+        tier2_groups=len(tier2["divisions"]),
+        tier2_teams_per_group=tier2["divisions"][0]["teams"],
+    )
+
+
+def _reputation_tier(reputation: int) -> str:
+    """Tier label from the reputation scale in the summary below."""
+    if reputation >= 90:
+        return "elite"
+    if reputation >= 80:
+        return "strong"
+    if reputation >= 70:
+        return "good"
+    if reputation >= 60:
+        return "average"
+    if reputation >= 50:
+        return "developing"
+    if reputation >= 40:
+        return "weak"
+    return "very_weak"
+
+
+@lru_cache(maxsize=1)
+def _build_lookups() -> dict:
+    """All derived lookups, keyed by their public module attribute name."""
+    import numpy as np
+
+    config = get_league_config()
+    countries = tuple(_build_country(name, cfg) for name, cfg in config.items())
+    reputation = {country.name: country.reputation for country in countries}
+
+    return {
+        "COUNTRIES": countries,
+        # Country name -> index into COUNTRIES / the column arrays below
+        "COUNTRY_INDEX": {country.name: i for i, country in enumerate(countries)},
+        # Column views for bulk queries, e.g. COUNTRY_REPUTATION[COUNTRY_ACTIVE].mean()
+        "COUNTRY_NAMES": tuple(country.name for country in countries),
+        "COUNTRY_ACTIVE": np.fromiter((c.active for c in countries), dtype=bool, count=len(countries)),
+        "COUNTRY_REPUTATION": np.fromiter((c.reputation for c in countries), dtype=np.int16, count=len(countries)),
+        "COUNTRY_SYSTEM": tuple(country.system for country in countries),
+        # Country name -> config (league_config is already keyed by name)
+        "COUNTRY_BY_NAME": config,
+        # Only countries enabled for the current launch
+        "ACTIVE_LEAGUES": {c.name: config[c.name] for c in countries if c.active},
+        # Country name -> reputation (1-100) and tier ("elite", "strong", "good", ...)
+        "REPUTATION": reputation,
+        "REPUTATION_TIER": {name: _reputation_tier(rep) for name, rep in reputation.items()},
+        # Country name -> teams in its tier 1 league
+        "TIER1_TEAMS": {country.name: country.tier1_teams for country in countries},
+        # Country name -> total teams across all tiers and groups
+        "TEAMS_PER_COUNTRY": {name: cfg["total_teams"] for name, cfg in config.items()},
     }
-}
+
+
+_LOOKUP_NAMES = frozenset({
+    "COUNTRIES", "COUNTRY_INDEX", "COUNTRY_NAMES", "COUNTRY_ACTIVE", "COUNTRY_REPUTATION",
+    "COUNTRY_SYSTEM", "COUNTRY_BY_NAME", "ACTIVE_LEAGUES", "REPUTATION", "REPUTATION_TIER",
+    "TIER1_TEAMS", "TEAMS_PER_COUNTRY",
+})
+
+
+def __getattr__(name: str):
+    """
+    PEP 562 lazy attributes: `league_config` and the derived lookups are
+    only built the first time someone imports/accesses them.
+    """
+    if name == "league_config":
+        return get_league_config()
+    if name in _LOOKUP_NAMES:
+        return _build_lookups()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ==========================================
 # 📊 CONFIGURATION SUMMARY
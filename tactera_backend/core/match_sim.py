@@ -1,22 +1,23 @@
 # tactera_backend/core/match_sim.py - SUBSTITUTION INTEGRATION
 
 import random
-from typing import Set, Optional, List
+from collections import Counter
+from itertools import chain
+from typing import Dict, Set, Optional, List, Tuple
+import numpy as np
+from sqlalchemy import and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from datetime import datetime, timezone, timedelta
-from sqlmodel import select
+from sqlalchemy.orm import joinedload
+from datetime import datetime, timezone
+from sqlmodel import Session, select
 from tactera_backend.models.match_model import Match
 from tactera_backend.models.player_model import Player
 from tactera_backend.models.club_model import Club
-from tactera_backend.models.stadium_model import Stadium
 from tactera_backend.models.injury_model import Injury
-from tactera_backend.core.injury_generator import calculate_injury_risk, generate_injury
-from tactera_backend.core.injury_config import REINJURY_MULTIPLIER
-from tactera_backend.core.config import TEST_MODE
+from tactera_backend.core.injury_generator import calculate_injury_risk_vec, generate_injuries
+from tactera_backend.core.config import TEST_MODE, RANDOM_SEED, VERBOSE_INJURY_LOG, UTC_PLUS_2
 from tactera_backend.models.suspension_model import Suspension
-from tactera_backend.models.formation_model import ClubFormation, FormationTemplate, MatchSquad, MatchSubstitution
-from tactera_backend.core.database import sync_engine
+from tactera_backend.models.formation_model import ClubFormation, MatchSquad, MatchSubstitution
 
 # =========================================
 # 🟨🟥 Booking & Suspension Configuration
@@ -39,37 +40,114 @@ RED_SUSPENSION_MAX = 3   # up to 3 matches
 TWO_YELLOWS_SUSPENSION = 1
 
 
+def match_rngs(fixture_id: int):
+    """
+    Per-match RNG pair: (random.Random for scalar draws, NumPy Generator for
+    vectorized rolls). Seeded from (TACTERA_RANDOM_SEED, fixture_id) so a
+    fixture replays identically under a fixed seed; system entropy otherwise.
+    Independent per match, so concurrent simulations never share RNG state.
+    """
+    seed = None if RANDOM_SEED is None else [RANDOM_SEED, fixture_id]
+    np_rng = np.random.default_rng(np.random.SeedSequence(seed))
+    return random.Random(int(np_rng.integers(2**63))), np_rng
+
+
+# Shared NumPy RNG for helpers called without a per-match generator (seedable via TACTERA_RANDOM_SEED)
+_np_rng = np.random.default_rng(RANDOM_SEED)
+
+# Match result "injuries" are columnar: one parallel list per column, one entry per injury
+# (e.g. result["injuries"]["name"][i]), so results from many matches concatenate cheaply
+INJURY_SUMMARY_COLUMNS = (
+    "player_id", "player_name", "reinjury", "name", "type", "severity",
+    "days_total", "rehab_start", "rehab_xp_multiplier", "fit_for_matches",
+)
+
+
+def _empty_injury_summary() -> dict:
+    return {column: [] for column in INJURY_SUMMARY_COLUMNS}
+
+
+# "bookings" and "send_offs" are lists of event dicts with these keys; the minute
+# loop collects plain row tuples and builds the dicts once on return
+BOOKING_COLUMNS = ("player_id", "minute", "type")
+SEND_OFF_COLUMNS = ("player_id", "minute", "reason")
+
+
+def _rows_to_dicts(rows: list, columns) -> list:
+    """Turn event row tuples into the API's list of {column: value} dicts."""
+    return [dict(zip(columns, row)) for row in rows]
+
+
+# Per-minute booking chance, and per-booking roll thresholds: [home side, direct red]
+_BOOKING_PROB = 0.01  # 1% booking per minute
+_BOOKING_EVENT_THRESHOLDS = np.array([0.5, 0.15])  # 50/50 side, 15% red
+
+
+def _draw_booking_events(rng: np.random.Generator, minutes: int = 90):
+    """
+    Pure NumPy booking kernel: one booking roll per minute, then the side and
+    red rolls (compared against _BOOKING_EVENT_THRESHOLDS) only for the minutes
+    that were booked, ~3x fewer draws than rolling all three per minute.
+    Returns parallel arrays for the booked minutes only:
+    (minute [1-based], is_home, is_red).
+    """
+    minute_idx = np.flatnonzero(rng.random(minutes) < _BOOKING_PROB)
+    events = rng.random((len(minute_idx), 2)) < _BOOKING_EVENT_THRESHOLDS
+    return minute_idx + 1, events[:, 0], events[:, 1]
+
+
+def swap_pop(items: list, idx: int) -> Optional[int]:
+    """O(1) unordered removal: move the last item into idx, then pop.
+    Returns the moved item, or None when idx was the last slot."""
+    last = items.pop()
+    if idx < len(items):
+        items[idx] = last
+        return last
+    return None
+
+
+def _swap_remove(items: list, pos: dict, item: int) -> None:
+    """swap_pop by value, keeping the item -> index map `pos` in sync."""
+    idx = pos.pop(item)
+    moved = swap_pop(items, idx)
+    if moved is not None:
+        pos[moved] = idx
+
+
 # ----------------------------------------------------
 # Helper: randomly generate bookings for a team squad
 # ----------------------------------------------------
-def generate_team_bookings(player_ids: list[int]) -> dict:
+def generate_team_bookings(player_ids: list[int], rng: Optional[np.random.Generator] = None) -> dict:
     """
     Returns a dict with per-player bookings for one team:
     {
       "yellow_counts": {player_id: n_yellows_this_match, ...},
       "direct_reds": [player_id, ...]
     }
+    Pass `rng` (e.g. a match_rngs() generator) to draw from a specific stream.
     """
     if not player_ids:
         return {"yellow_counts": {}, "direct_reds": []}
+    rng = rng or _np_rng
+    n = len(player_ids)
 
-    # How many yellows shall we give this team?
-    num_yellows = random.randint(YELLOW_CARDS_MIN, YELLOW_CARDS_MAX)
-
-    yellow_counts = {}
-    for _ in range(num_yellows):
-        pid = random.choice(player_ids)
-        yellow_counts[pid] = yellow_counts.get(pid, 0) + 1
+    # How many yellows shall we give this team? Spread them uniformly over the squad in one draw
+    num_yellows = int(rng.integers(YELLOW_CARDS_MIN, YELLOW_CARDS_MAX + 1))
+    counts = rng.multinomial(num_yellows, np.full(n, 1 / n)).tolist()
+    yellow_counts = Counter({pid: c for pid, c in zip(player_ids, counts) if c})
 
     # Maybe a direct red (independent of the yellows)
     direct_reds = []
-    if random.random() < DIRECT_RED_PROB:
-        pid = random.choice(player_ids)
-        direct_reds.append(pid)
+    if rng.random() < DIRECT_RED_PROB:
+        direct_reds.append(player_ids[int(rng.integers(n))])
 
     return {"yellow_counts": yellow_counts, "direct_reds": direct_reds}
 
 
+# Booking types listed for a player with 0, 1 or 2+ yellows this match
+_YELLOW_BOOKING_TYPES = ((), ("yellow",), ("yellow", "yellow", "second_yellow_red"))
+
+
 # ---------------------------------------------------------
 # Helper: assemble a bookings payload for API visibility
 # ---------------------------------------------------------
@@ -82,37 +160,89 @@ def build_bookings_payload(home_data: dict, away_data: dict) -> dict:
     }
     """
     def expand(side_dict):
-        events = []
-        # Yellows
-        for pid, cnt in side_dict["yellow_counts"].items():
-            for _ in range(min(cnt, 2)):  # list each yellow separately (cap at 2 for readability)
-                events.append({"player_id": pid, "type": "yellow"})
-            if cnt >= 2:
-                events.append({"player_id": pid, "type": "second_yellow_red"})
-        # Direct reds
-        for pid in side_dict["direct_reds"]:
-            events.append({"player_id": pid, "type": "red"})
-        return events
+        # Yellows (each listed separately, capped at 2, then the resulting red) + direct reds
+        return [
+            {"player_id": pid, "type": booking_type}
+            for pid, cnt in side_dict["yellow_counts"].items()
+            for booking_type in _YELLOW_BOOKING_TYPES[cnt if cnt < 2 else 2]
+        ] + [{"player_id": pid, "type": "red"} for pid in side_dict["direct_reds"]]
 
     return {
         "home": expand(home_data),
         "away": expand(away_data),
     }
 
-async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = None) -> dict:
+async def get_available_players_by_club(db: AsyncSession, club_ids: List[int]) -> dict:
+    """
+    Fetch every non-injured player of the given clubs in ONE query
+    (LEFT OUTER JOIN on active injuries, keep rows with no match).
+    The anti-join only touches Injury.player_id, so it is answered from the
+    partial ix_injury_active_player index without reading injury rows.
+    Returns {club_id: [Player, ...]}.
+    """
+    result = await db.execute(
+        select(Player)
+        .outerjoin(Injury, and_(Injury.player_id == Player.id, Injury.days_remaining > 0))
+        .where(Player.club_id.in_(club_ids), Injury.player_id == None)
+    )
+    players_by_club = {club_id: [] for club_id in club_ids}
+    for player in result.scalars().all():
+        players_by_club[player.club_id].append(player)
+    return players_by_club
+
+
+async def get_squad_selections(db: AsyncSession, match_ids: List[int], club_ids: List[int]) -> tuple:
+    """
+    Fetch existing MatchSquads and active formations for many clubs/matches
+    in two queries. Returns ({(match_id, club_id): MatchSquad}, {club_id: ClubFormation}).
+    """
+    result = await db.execute(
+        select(MatchSquad).where(MatchSquad.match_id.in_(match_ids), MatchSquad.club_id.in_(club_ids))
+    )
+    match_squads = {(squad.match_id, squad.club_id): squad for squad in result.scalars().all()}
+    result = await db.execute(
+        select(ClubFormation).where(ClubFormation.club_id.in_(club_ids), ClubFormation.is_active == True)
+    )
+    formations = {formation.club_id: formation for formation in result.scalars().all()}
+    return match_squads, formations
+
+
+async def get_scheduled_substitutions(db: AsyncSession, match_ids: List[int]) -> Dict[int, Dict[int, list]]:
+    """
+    Fetch the pre-scheduled MatchSubstitutions of many matches in one query.
+    Returns {match_id: {minute: [MatchSubstitution, ...]}}, each minute's list
+    in substitution_number order.
+    """
+    result = await db.execute(
+        select(MatchSubstitution).where(
+            MatchSubstitution.match_id.in_(match_ids)
+        ).order_by(MatchSubstitution.minute, MatchSubstitution.substitution_number)
+    )
+    by_match = {match_id: {} for match_id in match_ids}
+    for sub in result.scalars().all():
+        by_match[sub.match_id].setdefault(sub.minute, []).append(sub)
+    return by_match
+
+
+async def get_club_match_squad(
+    db: AsyncSession,
+    club_id: int,
+    match_id: int = None,
+    available_players: Optional[List[Player]] = None,
+    selections: Optional[tuple] = None,
+    commit: bool = True
+) -> dict:
     """
     Get a club's match squad (7-23 players) and starting XI (7-11 players).
     Falls back to auto-selection if no manual selection exists.
     NOW INCLUDES: Substitution tracking initialization for new matches.
+    Pass `available_players` (from get_available_players_by_club) to skip the player query,
+    and `selections` (from get_squad_selections) to skip the MatchSquad/formation queries.
+    With commit=False a new MatchSquad is only added to the session; the caller commits.
     """
     # Get all available players (exclude fully injured)
-    result = await db.execute(
-        select(Player).where(
-            Player.club_id == club_id,
-            ~Player.id.in_(select(Injury.player_id).where(Injury.days_remaining > 0))
-        )
-    )
-    available_players = result.scalars().all()
+    if available_players is None:
+        available_players = (await get_available_players_by_club(db, [club_id]))[club_id]
     
     # Check if we have enough players for minimum match squad
     if len(available_players) < 7:
@@ -128,7 +258,9 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
     # NEW: Check if MatchSquad already exists for this match
     # ==========================================
     existing_match_squad = None
-    if match_id:
+    if match_id and selections is not None:
+        existing_match_squad = selections[0].get((match_id, club_id))
+    elif match_id:
         result = await db.execute(
             select(MatchSquad).where(
                 MatchSquad.match_id == match_id,
@@ -142,10 +274,10 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
         match_squad_ids = set(existing_match_squad.selected_players)
         starting_xi_ids = set(existing_match_squad.starting_xi)
         
-        # Filter to only available players (in case of new injuries since squad selection)
-        available_ids = {p.id for p in available_players}
-        match_squad = [p for p in available_players if p.id in match_squad_ids & available_ids]
-        starting_xi = [p for p in available_players if p.id in starting_xi_ids & available_ids]
+        # Filter to only available players (in case of new injuries since squad selection);
+        # iterating available_players already restricts to available ids
+        match_squad = [p for p in available_players if p.id in match_squad_ids]
+        starting_xi = [p for p in available_players if p.id in starting_xi_ids]
         
         return {
             "can_play": len(starting_xi) >= 7,
@@ -171,13 +303,16 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
     
     # Select starting XI from match squad (7-11 players)
     # Priority: use formation if available, otherwise auto-select
-    result = await db.execute(
-        select(ClubFormation).where(
-            ClubFormation.club_id == club_id,
-            ClubFormation.is_active == True
+    if selections is not None:
+        club_formation = selections[1].get(club_id)
+    else:
+        result = await db.execute(
+            select(ClubFormation).where(
+                ClubFormation.club_id == club_id,
+                ClubFormation.is_active == True
+            )
         )
-    )
-    club_formation = result.scalar_one_or_none()
+        club_formation = result.scalar_one_or_none()
     
     if club_formation and club_formation.player_assignments:
         # Use formation assignments for starting XI
@@ -186,11 +321,12 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
         
         # Filter assigned players to only those in the match squad and available
         valid_assignments = [pid for pid in assigned_player_ids if pid in match_squad_ids]
+        valid_assignment_ids = set(valid_assignments)
         
         # ✅ FLEXIBLE STARTING XI: Use what's assigned (7-11 players)
         if len(valid_assignments) >= 7:
             # Have enough assigned players - use them (even if less than 11)
-            starting_xi_ids = valid_assignments[:11]  # Cap at 11 maximum
+            starting_xi_ids = set(valid_assignments[:11])  # Cap at 11 maximum
             starting_xi = [p for p in match_squad if p.id in starting_xi_ids]
             formation_info = {
                 "has_formation": True,
@@ -200,10 +336,10 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
             }
         else:
             # Not enough assigned players - fill up to reach minimum 7
-            unassigned = [p for p in match_squad if p.id not in valid_assignments]
+            unassigned = [p for p in match_squad if p.id not in valid_assignment_ids]
             needed = max(7, len(valid_assignments)) - len(valid_assignments)
             
-            starting_xi_ids = valid_assignments + [p.id for p in unassigned[:needed]]
+            starting_xi_ids = valid_assignment_ids.union(p.id for p in unassigned[:needed])
             starting_xi = [p for p in match_squad if p.id in starting_xi_ids]
             formation_info = {
                 "has_formation": True,
@@ -236,8 +372,8 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
             is_finalized=False
         )
         db.add(new_match_squad)
-        await db.commit()
-        await db.refresh(new_match_squad)
+        if commit:
+            await db.commit()
     
     return {
         "can_play": True,
@@ -255,25 +391,117 @@ async def get_club_match_squad(db: AsyncSession, club_id: int, match_id: int = N
 # NEW: SUBSTITUTION-AWARE MATCH SIMULATION
 # ==========================================
 
-async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
+async def _get_fixtures_with_clubs(db: AsyncSession, condition) -> List[Match]:
+    """Fixtures matching `condition` with both clubs + stadiums eager-loaded, in one query."""
+    result = await db.execute(
+        select(Match)
+        .options(
+            joinedload(Match.home_club).joinedload(Club.stadium),
+            joinedload(Match.away_club).joinedload(Club.stadium),
+        )
+        .where(condition)
+    )
+    return result.scalars().all()
+
+
+def _clubs_of(fixtures) -> dict:
+    """{club_id: Club} from fixtures loaded by _get_fixtures_with_clubs."""
+    clubs = {}
+    for fixture in fixtures:
+        clubs[fixture.home_club_id] = fixture.home_club
+        clubs[fixture.away_club_id] = fixture.away_club
+    return clubs
+
+
+async def _get_active_injuries_by_player(db: AsyncSession, condition) -> dict:
+    """
+    {player_id: latest active Injury} for injuries matching `condition`.
+    Injuries are joined to their Player, so `condition` may filter on either
+    (e.g. Player.club_id for a whole round).
+    """
+    result = await db.execute(
+        select(Injury)
+        .join(Player, Player.id == Injury.player_id)
+        .where(condition, Injury.days_remaining > 0)
+        .order_by(Injury.start_date)
+    )
+    return {injury.player_id: injury for injury in result.scalars().all()}
+
+
+def _print_match_summary(
+    home_goals, away_goals, injuries, send_offs, substitutions,
+    newly_suspended_players, revenue_info, match_revenue
+) -> None:
+    """TEST_MODE console summary; only called (and formatted) when debugging."""
+    total_injuries = len(injuries["player_id"])
+    reinjury_count = sum(injuries["reinjury"])
+    print(f"\n📊 Enhanced Match Summary:")
+    print(f"   Score: {home_goals}-{away_goals}")
+    print(f"   Injuries: {total_injuries} total ({total_injuries - reinjury_count} new, {reinjury_count} reinjuries)")
+    print(f"   Send-offs: {len(send_offs)}")
+    print(f"   Substitutions: {len(substitutions)}")
+    print(f"   New suspensions: {len(newly_suspended_players)}")
+    print("🏁 Enhanced match simulation complete!\n")
+    print(f"   💰 Match Revenue: {revenue_info['stadium_name']} - {revenue_info['attendance']:,} fans")
+    print(f"      Ticket price: ${revenue_info['ticket_price']:.2f} × {revenue_info['attendance']:,} = ${match_revenue:,}")
+
+
+async def simulate_match_with_substitutions(
+    db: AsyncSession,
+    fixture_id: int,
+    *,
+    fixture: Optional[Match] = None,
+    clubs: Optional[dict] = None,
+    available: Optional[dict] = None,
+    rehab_by_player: Optional[dict] = None,
+    rngs: Optional[tuple] = None,
+    selections: Optional[tuple] = None,
+    substitutions: Optional[dict] = None
+):
     """
     Enhanced match simulation that can handle live substitutions.
     This version tracks current players on pitch throughout the match.
+    The keyword arguments take data already bulk-loaded by simulate_matchday
+    (fixture, {club_id: Club}, {club_id: [Player]}, {player_id: Injury},
+    get_squad_selections output, this match's get_scheduled_substitutions entry);
+    anything not passed is fetched here.
     """
     
-    # 1️⃣ Fetch fixture
-    result = await db.execute(select(Match).where(Match.id == fixture_id))
-    fixture = result.scalar_one_or_none()
-    if not fixture:
-        raise ValueError(f"Fixture with ID {fixture_id} not found.")
+    # TEST_MODE is a process-level constant: read it once into a local
+    debug = TEST_MODE
+
+    # This match's own RNGs (see match_rngs); shared with the minute simulation
+    rng, np_rng = rngs if rngs is not None else match_rngs(fixture_id)
 
-    # 2️⃣ Fetch clubs
-    home_club = await db.get(Club, fixture.home_club_id)
-    away_club = await db.get(Club, fixture.away_club_id)
+    # One clock read per match: fixture time and injury start dates share it
+    now_utc = datetime.utcnow()
+    now_local = now_utc.replace(tzinfo=timezone.utc).astimezone(UTC_PLUS_2)
+
+    # 1️⃣ + 2️⃣ Fetch fixture with both clubs (+ stadiums) in one query
+    if fixture is None:
+        fixtures = await _get_fixtures_with_clubs(db, Match.id == fixture_id)
+        if not fixtures:
+            raise ValueError(f"Fixture with ID {fixture_id} not found.")
+        fixture = fixtures[0]
+    if clubs is None:
+        clubs = _clubs_of([fixture])
+    home_club = clubs[fixture.home_club_id]
+    away_club = clubs[fixture.away_club_id]
 
     # 3️⃣ Fetch match squads and starting XIs (this creates MatchSquad records)
-    home_squad_info = await get_club_match_squad(db, fixture.home_club_id, fixture.id)
-    away_squad_info = await get_club_match_squad(db, fixture.away_club_id, fixture.id)
+    # Both clubs' available players, existing squads and formations in one query each
+    club_ids = [fixture.home_club_id, fixture.away_club_id]
+    if available is None:
+        available = await get_available_players_by_club(db, club_ids)
+    if selections is None:
+        selections = await get_squad_selections(db, [fixture.id], club_ids)
+    # New MatchSquad records are committed together with the match result
+    home_squad_info = await get_club_match_squad(
+        db, fixture.home_club_id, fixture.id, available[fixture.home_club_id], selections, commit=False
+    )
+    away_squad_info = await get_club_match_squad(
+        db, fixture.away_club_id, fixture.id, available[fixture.away_club_id], selections, commit=False
+    )
     
     # Check if both teams can field minimum squads
     if not home_squad_info["can_play"]:
@@ -281,7 +509,7 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
         fixture.home_goals = 0
         fixture.away_goals = 3
         fixture.is_played = True
-        fixture.match_time = datetime.utcnow()
+        fixture.match_time = now_utc
         await db.commit()
         
         return {
@@ -291,7 +519,7 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
             "final_score": "0-3 (Walkover)",
             "home_goals": 0,
             "away_goals": 3,
-            "injuries": [],
+            "injuries": _empty_injury_summary(),
             "bookings": [],
             "send_offs": [],
             "substitutions": []
@@ -302,7 +530,7 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
         fixture.home_goals = 3
         fixture.away_goals = 0
         fixture.is_played = True
-        fixture.match_time = datetime.utcnow()
+        fixture.match_time = now_utc
         await db.commit()
         
         return {
@@ -312,7 +540,7 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
             "final_score": "3-0 (Walkover)",
             "home_goals": 3,
             "away_goals": 0,
-            "injuries": [],
+            "injuries": _empty_injury_summary(),
             "bookings": [],
             "send_offs": [],
             "substitutions": []
@@ -322,21 +550,20 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
     home_players = home_squad_info["starting_xi"]
     away_players = away_squad_info["starting_xi"]
     
-    if TEST_MODE:
+    if debug:
         print(f"\n🏁 Starting substitution-aware match simulation: {home_club.name} vs {away_club.name}")
         print(f"   Home: {len(home_players)} starting players (squad: {home_squad_info['match_squad_size']})")
         print(f"   Away: {len(away_players)} starting players (squad: {away_squad_info['match_squad_size']})")
 
     # 4️⃣ Stadium pitch quality
-    stadium_result = await db.execute(select(Stadium).where(Stadium.club_id == home_club.id))
-    stadium = stadium_result.scalar_one_or_none()
-    pitch_quality = stadium.pitch_quality if stadium else 50
+    pitch_quality = home_club.stadium.pitch_quality if home_club.stadium else 50
 
     # =========================================
     # 🕐 NEW: Enhanced minute-based simulation with substitution support
     # =========================================
     match_events = await simulate_minute_based_events_with_substitutions_async(
-        home_players, away_players, fixture.id, db
+        home_players, away_players, fixture.id, db, rngs=(rng, np_rng),
+        substitutions=substitutions
     )
     
     home_goals = match_events["home_goals"]
@@ -345,7 +572,7 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
     send_offs = match_events["send_offs"]
     substitutions = match_events["substitutions"]
     
-    if TEST_MODE:
+    if debug:
         print(f"   Final score: {home_goals}-{away_goals}")
         print(f"   Total bookings: {len(bookings_payload)}")
         print(f"   Players sent off: {len(send_offs)}")
@@ -355,145 +582,155 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
     fixture.home_goals = home_goals
     fixture.away_goals = away_goals
     fixture.is_played = True
-    fixture.match_time = datetime.utcnow()
+    fixture.match_time = now_utc
 
     # =========================================
     # 🟥 Create suspensions AFTER match ends (unchanged)
     # =========================================
     newly_suspended_players = set()
     
-    # Process send-offs and create suspensions
+    # Process send-offs: collect (player_id, matches, reason), then upsert them in one go
+    # (every direct red's ban length drawn in one call)
+    suspension_entries = []
+    red_lengths = iter(np_rng.integers(
+        RED_SUSPENSION_MIN, RED_SUSPENSION_MAX + 1,
+        size=sum(send_off["reason"] == "direct_red" for send_off in send_offs)
+    ).tolist())
     for send_off in send_offs:
         player_id = send_off["player_id"]
         reason = send_off["reason"]
         
         if reason == "second_yellow":
-            suspension_length = 1  # TWO_YELLOWS_SUSPENSION
-            await create_or_update_suspension(db, player_id, suspension_length, "two_yellows")
+            suspension_length = TWO_YELLOWS_SUSPENSION
+            suspension_entries.append((player_id, suspension_length, "two_yellows"))
             newly_suspended_players.add(player_id)
-            if TEST_MODE:
+            if debug:
                 print(f"   📋 Created {suspension_length}-match suspension for player {player_id} (two yellows)")
                 
         elif reason == "direct_red":
-            suspension_length = random.randint(1, 3)  # RED_SUSPENSION_MIN, RED_SUSPENSION_MAX
-            await create_or_update_suspension(db, player_id, suspension_length, "red_card")
+            suspension_length = next(red_lengths)
+            suspension_entries.append((player_id, suspension_length, "red_card"))
             newly_suspended_players.add(player_id)
-            if TEST_MODE:
+            if debug:
                 print(f"   📋 Created {suspension_length}-match suspension for player {player_id} (red card)")
 
+    await create_or_update_suspensions_bulk(db, suspension_entries, now=now_utc)
+
     # =========================================
     # 📉 Decrement existing suspensions
     # =========================================
-    await decrement_suspensions_after_match(db, fixture.home_club_id, fixture.away_club_id)
+    await decrement_suspensions_after_match(
+        db, fixture.home_club_id, fixture.away_club_id, newly_suspended_players, now=now_utc
+    )
 
     # 6️⃣ Injury & Reinjury Risk Logic (only for players who finished the match on pitch)
-    injuries = []
+    injuries = _empty_injury_summary()
     base_risk = 0.05
-    all_players = list(home_players) + list(away_players)
     active_at_end = set(match_events["final_active_players"]["home"] + match_events["final_active_players"]["away"])
 
-    for player in all_players:
-        # Skip injury calculation for players who were sent off or substituted off
-        if player.id not in active_at_end:
-            if TEST_MODE:
-                print(f"   🚫 Skipping injury risk for player no longer on pitch: {player.first_name} {player.last_name}")
-            continue
+    # Prefetch existing (rehab) injuries for everyone still on the pitch in one query
+    # (no query at all when nobody finished the match on the pitch)
+    if rehab_by_player is None:
+        rehab_by_player = (
+            await _get_active_injuries_by_player(db, Injury.player_id.in_(active_at_end))
+            if active_at_end else {}
+        )
+    new_injury_rows = []  # Inserted in one executemany after the loop
 
-        energy = 100  
-        injury_proneness = 1.0  
+    # Skip injury calculation for players who were sent off or substituted off
+    on_pitch = []
+    for player in chain(home_players, away_players):
+        if player.id in active_at_end:
+            on_pitch.append(player)
+        elif VERBOSE_INJURY_LOG:
+            print(f"   🚫 Skipping injury risk for player no longer on pitch: {player.first_name} {player.last_name}")
 
-        # Check for existing rehab injury
-        rehab_injury = await db.execute(
-            select(Injury).where(Injury.player_id == player.id, Injury.days_remaining > 0)
-        )
-        rehab_injury = rehab_injury.scalar_one_or_none()
-
-        # Calculate risk
-        risk = calculate_injury_risk(base_risk, pitch_quality, energy, injury_proneness)
-
-        if rehab_injury and rehab_injury.days_remaining <= rehab_injury.rehab_start:
-            risk *= REINJURY_MULTIPLIER
-
-        # Roll for injury
-        if random.random() < risk:
-            new_injury_data = generate_injury()
-            tz = timezone(timedelta(hours=2))
-
-            # If reinjury during rehab: overwrite injury details
-            if rehab_injury:
-                rehab_injury.name = new_injury_data["name"]
-                rehab_injury.type = new_injury_data["type"]
-                rehab_injury.severity = new_injury_data["severity"]
-                rehab_injury.start_date = datetime.now(tz)
-                rehab_injury.days_total = new_injury_data["days_total"]
-                rehab_injury.rehab_start = new_injury_data["rehab_start"]
-                rehab_injury.rehab_xp_multiplier = new_injury_data["rehab_xp_multiplier"]
-                rehab_injury.fit_for_matches = False
-                rehab_injury.days_remaining = new_injury_data["days_total"]
-                if TEST_MODE:
-                    print(f"   🔁 Reinjury Event: {player.first_name} {player.last_name} aggravated an existing injury!")
-            else:
-                # Fresh injury assignment
-                new_injury = Injury(
-                    player_id=player.id,
-                    name=new_injury_data["name"],
-                    type=new_injury_data["type"],
-                    severity=new_injury_data["severity"],
-                    start_date=datetime.now(tz),
-                    days_total=new_injury_data["days_total"],
-                    rehab_start=new_injury_data["rehab_start"],
-                    rehab_xp_multiplier=new_injury_data["rehab_xp_multiplier"],
-                    fit_for_matches=new_injury_data["fit_for_matches"],
-                    days_remaining=new_injury_data["days_total"]
-                )
-                db.add(new_injury)
-
-            injuries.append({
+    # Risk for every player on the pitch in one vectorized pass (rehab players get the reinjury multiplier)
+    n_on_pitch = len(on_pitch)
+    energy = np.full(n_on_pitch, 100.0)
+    injury_proneness = np.ones(n_on_pitch)
+    in_rehab = np.array([
+        player.id in rehab_by_player
+        and rehab_by_player[player.id].days_remaining <= rehab_by_player[player.id].rehab_start
+        for player in on_pitch
+    ], dtype=bool)
+    risk = calculate_injury_risk_vec(base_risk, pitch_quality, energy, injury_proneness, in_rehab)
+
+    # One roll per player; only the injured enter the Python branch below
+    injured_idx = np.flatnonzero(np_rng.random(n_on_pitch) < risk)
+
+    # Injury details for everyone injured, drawn in one batch
+    for idx, new_injury_data in zip(injured_idx, generate_injuries(len(injured_idx), rng=rng)):
+        player = on_pitch[idx]
+        rehab_injury = rehab_by_player.get(player.id)
+
+        # If reinjury during rehab: overwrite injury details
+        if rehab_injury:
+            rehab_injury.name = new_injury_data["name"]
+            rehab_injury.type = new_injury_data["type"]
+            rehab_injury.severity = new_injury_data["severity"]
+            rehab_injury.start_date = now_local
+            rehab_injury.days_total = new_injury_data["days_total"]
+            rehab_injury.rehab_start = new_injury_data["rehab_start"]
+            rehab_injury.rehab_xp_multiplier = new_injury_data["rehab_xp_multiplier"]
+            rehab_injury.fit_for_matches = False
+            rehab_injury.days_remaining = new_injury_data["days_total"]
+            if debug:
+                print(f"   🔁 Reinjury Event: {player.first_name} {player.last_name} aggravated an existing injury!")
+        else:
+            # Fresh injury assignment (row for the bulk insert below)
+            new_injury_rows.append({
                 "player_id": player.id,
-                "player_name": f"{player.first_name} {player.last_name}",
-                "reinjury": bool(rehab_injury),
-                **new_injury_data
+                "name": new_injury_data["name"],
+                "type": new_injury_data["type"],
+                "severity": new_injury_data["severity"],
+                "start_date": now_local,
+                "days_total": new_injury_data["days_total"],
+                "rehab_start": new_injury_data["rehab_start"],
+                "rehab_xp_multiplier": new_injury_data["rehab_xp_multiplier"],
+                "fit_for_matches": new_injury_data["fit_for_matches"],
+                "days_remaining": new_injury_data["days_total"]
             })
 
+        injuries["player_id"].append(player.id)
+        injuries["player_name"].append(f"{player.first_name} {player.last_name}")
+        injuries["reinjury"].append(bool(rehab_injury))
+        for key, value in new_injury_data.items():
+            injuries[key].append(value)
+
     # Final commit of all changes
-    await db.commit()
-    await db.refresh(fixture)
+    if new_injury_rows:
+        await db.execute(Injury.__table__.insert(), new_injury_rows)
+    await db.commit()  # No refresh: every field we return was set locally (sessions don't expire on commit)
     
     # =========================================
     # 💰 NEW: Calculate and add match revenue for home club
     # =========================================
     from tactera_backend.services.finance_service import calculate_match_revenue, add_revenue
+    from tactera_backend.core.database import sync_engine  # Only needed for the revenue step
 
-    # Calculate revenue based on stadium and attendance
-    revenue_info = calculate_match_revenue(
-        session=Session(sync_engine),  # Use sync session for finance service
-        home_club_id=fixture.home_club_id,
-        attendance_percentage=0.8  # 80% attendance for now (we can make this dynamic later)
-    )
-
+    # Calculate revenue based on stadium and attendance, then add it to the home club
+    # (one sync session for the finance service; the stadium came with the fixture)
     match_revenue = 0
-    if revenue_info["success"]:
-        match_revenue = revenue_info["total_revenue"]
-        
-        # Add revenue to home club using sync session
-        with Session(sync_engine) as sync_session:
+    with Session(sync_engine) as sync_session:
+        revenue_info = calculate_match_revenue(
+            session=sync_session,
+            home_club_id=fixture.home_club_id,
+            attendance_percentage=0.8,  # 80% attendance for now (we can make this dynamic later)
+            stadium=home_club.stadium
+        )
+        if revenue_info["success"]:
+            match_revenue = revenue_info["total_revenue"]
             add_revenue(sync_session, fixture.home_club_id, match_revenue, "match_revenue")
-        
-        if TEST_MODE:
-            total_injuries = len(injuries)
-            reinjury_count = sum(1 for inj in injuries if inj["reinjury"])
-            print(f"\n📊 Enhanced Match Summary:")
-            print(f"   Score: {home_goals}-{away_goals}")
-            print(f"   Injuries: {total_injuries} total ({total_injuries - reinjury_count} new, {reinjury_count} reinjuries)")
-            print(f"   Send-offs: {len(send_offs)}")
-            print(f"   Substitutions: {len(substitutions)}")
-            print(f"   New suspensions: {len(newly_suspended_players)}")
-            print("🏁 Enhanced match simulation complete!\n")
-            print(f"   💰 Match Revenue: {revenue_info['stadium_name']} - {revenue_info['attendance']:,} fans")
-            print(f"      Ticket price: ${revenue_info['ticket_price']:.2f} × {revenue_info['attendance']:,} = ${match_revenue:,}")
+
+    if debug and revenue_info["success"]:
+        _print_match_summary(
+            home_goals, away_goals, injuries, send_offs, substitutions,
+            newly_suspended_players, revenue_info, match_revenue
+        )
 
     return {
-        "fixture_id": fixture.id,
+        "fixture_id": fixture_id,
         "home_club_id": fixture.home_club_id,
         "away_club_id": fixture.away_club_id,
         "home_goals": home_goals,
@@ -534,25 +771,41 @@ async def simulate_match_with_substitutions(db: AsyncSession, fixture_id: int):
 # 🕐 NEW: Enhanced minute-based simulation with substitutions
 # =========================================
 async def simulate_minute_based_events_with_substitutions_async(
-    home_players, away_players, match_id: int, db: AsyncSession
+    home_players, away_players, match_id: int, db: AsyncSession, rngs: Optional[tuple] = None,
+    substitutions: Optional[dict] = None
 ) -> dict:
     """
     Enhanced minute-by-minute simulation that can apply substitutions from the database.
     This reads any MatchSubstitution records for the match and applies them at the correct minute.
+    Draws from `rngs` (see match_rngs); defaults to the match's own RNG pair.
+    `substitutions` takes the match's {minute: [MatchSubstitution]} from
+    get_scheduled_substitutions; they are loaded here otherwise.
     """
-    from typing import Set
+    # TEST_MODE is a process-level constant: read it once into a local for the minute loop
+    debug = TEST_MODE
+    rng, np_rng = rngs if rngs is not None else match_rngs(match_id)
     
-    # Track which players are still on the pitch (start with all starting XI)
-    home_active: Set[int] = {p.id for p in home_players}
-    away_active: Set[int] = {p.id for p in away_players}
+    # Every player who takes the pitch gets a fixed slot for the match (starting XI
+    # first, substitutes appended as they come on); slot -> player_id is *_ids
+    home_ids: List[int] = [p.id for p in home_players]
+    away_ids: List[int] = [p.id for p in away_players]
+    home_slots: Dict[int, int] = {pid: i for i, pid in enumerate(home_ids)}
+    away_slots: Dict[int, int] = {pid: i for i, pid in enumerate(away_ids)}
+
+    # Track which slots are still on the pitch: a list for O(1) random picks,
+    # plus slot -> list index for membership and O(1) swap-and-pop removal
+    home_active_list: List[int] = list(range(len(home_ids)))
+    away_active_list: List[int] = list(range(len(away_ids)))
+    home_pos: Dict[int, int] = {slot: slot for slot in home_active_list}
+    away_pos: Dict[int, int] = {slot: slot for slot in away_active_list}
     
-    # Track bookings throughout the match
-    home_yellows = {}
-    away_yellows = {}
+    # Track bookings throughout the match: yellow count per slot
+    home_yellows: List[int] = [0] * len(home_ids)
+    away_yellows: List[int] = [0] * len(away_ids)
     
-    # Store events
-    bookings_with_minutes = []
-    send_offs = []
+    # Store events as (player_id, minute, type/reason) rows; turned into dicts on return
+    booking_rows = []
+    send_off_rows = []
     applied_substitutions = []  # NEW: Track applied substitutions
     
     # Match state
@@ -560,33 +813,47 @@ async def simulate_minute_based_events_with_substitutions_async(
     abandonment_reason = ""
     abandonment_minute = 90
     
-    # Simulate goals
-    home_goals = random.randint(0, 4)
-    away_goals = random.randint(0, 4)
+    # Simulate goals (0-4 each)
+    home_goals, away_goals = np_rng.integers(0, 5, size=2).tolist()
     
     # ==========================================
     # NEW: Load all substitutions for this match
     # ==========================================
-    result = await db.execute(
-        select(MatchSubstitution).where(
-            MatchSubstitution.match_id == match_id
-        ).order_by(MatchSubstitution.minute, MatchSubstitution.substitution_number)
+    # Grouped by minute for easy lookup (pre-fetched per round by simulate_matchday)
+    substitutions_by_minute = (
+        substitutions if substitutions is not None
+        else (await get_scheduled_substitutions(db, [match_id]))[match_id]
     )
-    scheduled_substitutions = result.scalars().all()
     
-    # Group substitutions by minute for easy lookup
-    substitutions_by_minute = {}
-    for sub in scheduled_substitutions:
-        minute = sub.minute
-        if minute not in substitutions_by_minute:
-            substitutions_by_minute[minute] = []
-        substitutions_by_minute[minute].append(sub)
-    
-    if TEST_MODE and scheduled_substitutions:
-        print(f"   📋 Found {len(scheduled_substitutions)} pre-scheduled substitutions")
+    if debug and substitutions_by_minute:
+        n_scheduled = sum(len(subs) for subs in substitutions_by_minute.values())
+        print(f"   📋 Found {n_scheduled} pre-scheduled substitutions")
     
+    # Booking randomness for all 90 minutes drawn up front. Only ~1% of minutes
+    # have a booking, so the loop below visits just the minutes where something
+    # can happen instead of all 90.
+    booking_minutes, booking_home_rolls, booking_red_rolls = _draw_booking_events(np_rng)
+    booking_by_minute = {
+        minute: (is_home, is_red)
+        for minute, is_home, is_red in zip(
+            booking_minutes.tolist(), booking_home_rolls.tolist(), booking_red_rolls.tolist()
+        )
+    }
+
+    # Substitution minutes, booking minutes, and the minute after each booking
+    # (a send-off can trigger the 7-player rule at the start of the next minute)
+    event_minutes = sorted(
+        {minute for minute in substitutions_by_minute if 1 <= minute <= 90}
+        | set(booking_by_minute)
+        | {minute + 1 for minute in booking_by_minute if minute < 90}
+    )
+
+    # The 7-player rule is checked at the first event minute, then only again
+    # after a send-off or a substitution that left a side a player short
+    roster_shrunk = True
+
     # Simulate events throughout 90 minutes
-    for minute in range(1, 91):
+    for minute in event_minutes:
         # ==========================================
         # NEW: Apply any scheduled substitutions for this minute
         # ==========================================
@@ -596,10 +863,12 @@ async def simulate_minute_based_events_with_substitutions_async(
                 
                 # Determine which team this substitution affects
                 if club_id == home_players[0].club_id:  # Assume all home players have same club_id
-                    active_players = home_active
+                    active_pos, active_list = home_pos, home_active_list
+                    ids, slots, yellows = home_ids, home_slots, home_yellows
                     team_name = "HOME"
                 else:
-                    active_players = away_active
+                    active_pos, active_list = away_pos, away_active_list
+                    ids, slots, yellows = away_ids, away_slots, away_yellows
                     team_name = "AWAY"
                 
                 # Apply each player change in this substitution
@@ -608,9 +877,19 @@ async def simulate_minute_based_events_with_substitutions_async(
                     player_on = change["on"]
                     
                     # Validate substitution can still be applied
-                    if player_off in active_players:
-                        active_players.discard(player_off)  # Remove player going off
-                        active_players.add(player_on)       # Add player coming on
+                    slot_off = slots.get(player_off)
+                    if slot_off in active_pos:
+                        _swap_remove(active_list, active_pos, slot_off)  # Remove player going off
+                        slot_on = slots.get(player_on)
+                        if slot_on is None:  # First appearance: give the player a slot
+                            slot_on = slots[player_on] = len(ids)
+                            ids.append(player_on)
+                            yellows.append(0)
+                        if slot_on not in active_pos:  # Add player coming on
+                            active_pos[slot_on] = len(active_list)
+                            active_list.append(slot_on)
+                        else:
+                            roster_shrunk = True  # Nobody came on: one fewer player
                         
                         applied_substitutions.append({
                             "minute": minute,
@@ -622,135 +901,95 @@ async def simulate_minute_based_events_with_substitutions_async(
                             "reason": substitution.reason
                         })
                         
-                        if TEST_MODE:
+                        if debug:
                             print(f"   🔄 MINUTE {minute}: {team_name} substitution - Player {player_off} OFF, Player {player_on} ON")
                     else:
-                        if TEST_MODE:
+                        if debug:
                             print(f"   ⚠️ MINUTE {minute}: Cannot substitute player {player_off} - not on pitch")
         
-        # ✅ ENFORCE 7-PLAYER RULE (after substitutions)
-        if len(home_active) < 7:
-            match_abandoned = True
-            abandonment_reason = f"Home team insufficient players (minute {minute})"
-            abandonment_minute = minute
-            home_goals = 0
-            away_goals = 3
-            break
-        elif len(away_active) < 7:
-            match_abandoned = True
-            abandonment_reason = f"Away team insufficient players (minute {minute})"
-            abandonment_minute = minute
-            home_goals = 3
-            away_goals = 0
-            break
+        # ✅ ENFORCE 7-PLAYER RULE (after substitutions; only needed once a side lost a player)
+        if roster_shrunk:
+            roster_shrunk = False
+            if len(home_active_list) < 7:
+                match_abandoned = True
+                abandonment_reason = f"Home team insufficient players (minute {minute})"
+                abandonment_minute = minute
+                home_goals = 0
+                away_goals = 3
+                break
+            elif len(away_active_list) < 7:
+                match_abandoned = True
+                abandonment_reason = f"Away team insufficient players (minute {minute})"
+                abandonment_minute = minute
+                home_goals = 3
+                away_goals = 0
+                break
         
-        # Random chance of booking each minute (reduced rate for realism)
-        if random.random() < 0.01:  # 1% chance per minute
-            # Pick a random team that still has players
-            teams_available = []
-            if home_active:
-                teams_available.append("home")
-            if away_active:
-                teams_available.append("away")
-            
-            if not teams_available:
-                break  # No players left (shouldn't happen due to 7-player check)
-            
-            team = random.choice(teams_available)
-            
-            if team == "home" and home_active:
-                player_id = random.choice(list(home_active))
+        # Booking this minute? (pre-drawn above)
+        booking = booking_by_minute.get(minute)
+        if booking is None:
+            continue
+        is_home, is_red = booking
+
+        if is_home:
+            slot = home_active_list[rng.randrange(len(home_active_list))]
+            player_id = home_ids[slot]
+
+            if is_red:  # 15% chance of direct red
+                booking_rows.append((player_id, minute, "red"))
+                send_off_rows.append((player_id, minute, "direct_red"))
+                _swap_remove(home_active_list, home_pos, slot)
+                roster_shrunk = True
+                if debug:
+                    print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) sent off! Home now has {len(home_active_list)} players")
+            else:  # Yellow card
+                home_yellows[slot] += 1
+                booking_rows.append((player_id, minute, "yellow"))
                 
-                if random.random() < 0.15:  # 15% chance of direct red
-                    bookings_with_minutes.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "type": "red"
-                    })
-                    send_offs.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "reason": "direct_red"
-                    })
-                    home_active.discard(player_id)
-                    if TEST_MODE:
-                        print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) sent off! Home now has {len(home_active)} players")
-                else:  # Yellow card
-                    home_yellows[player_id] = home_yellows.get(player_id, 0) + 1
-                    bookings_with_minutes.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "type": "yellow"
-                    })
-                    
-                    if home_yellows[player_id] >= 2:  # Second yellow = red
-                        bookings_with_minutes.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "type": "second_yellow_red"
-                        })
-                        send_offs.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "reason": "second_yellow"
-                        })
-                        home_active.discard(player_id)
-                        if TEST_MODE:
-                            print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) second yellow! Home now has {len(home_active)} players")
-            
-            elif team == "away" and away_active:
-                # Same logic for away team
-                player_id = random.choice(list(away_active))
+                if home_yellows[slot] >= 2:  # Second yellow = red
+                    booking_rows.append((player_id, minute, "second_yellow_red"))
+                    send_off_rows.append((player_id, minute, "second_yellow"))
+                    _swap_remove(home_active_list, home_pos, slot)
+                    roster_shrunk = True
+                    if debug:
+                        print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) second yellow! Home now has {len(home_active_list)} players")
+        
+        else:
+            # Same logic for away team
+            slot = away_active_list[rng.randrange(len(away_active_list))]
+            player_id = away_ids[slot]
+
+            if is_red:  # Direct red
+                booking_rows.append((player_id, minute, "red"))
+                send_off_rows.append((player_id, minute, "direct_red"))
+                _swap_remove(away_active_list, away_pos, slot)
+                roster_shrunk = True
+                if debug:
+                    print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) sent off! Away now has {len(away_active_list)} players")
+            else:  # Yellow card
+                away_yellows[slot] += 1
+                booking_rows.append((player_id, minute, "yellow"))
                 
-                if random.random() < 0.15:  # Direct red
-                    bookings_with_minutes.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "type": "red"
-                    })
-                    send_offs.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "reason": "direct_red"
-                    })
-                    away_active.discard(player_id)
-                    if TEST_MODE:
-                        print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) sent off! Away now has {len(away_active)} players")
-                else:  # Yellow card
-                    away_yellows[player_id] = away_yellows.get(player_id, 0) + 1
-                    bookings_with_minutes.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "type": "yellow"
-                    })
-                    
-                    if away_yellows[player_id] >= 2:  # Second yellow = red
-                        bookings_with_minutes.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "type": "second_yellow_red"
-                        })
-                        send_offs.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "reason": "second_yellow"
-                        })
-                        away_active.discard(player_id)
-                        if TEST_MODE:
-                            print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) second yellow! Away now has {len(away_active)} players")
-    
+                if away_yellows[slot] >= 2:  # Second yellow = red
+                    booking_rows.append((player_id, minute, "second_yellow_red"))
+                    send_off_rows.append((player_id, minute, "second_yellow"))
+                    _swap_remove(away_active_list, away_pos, slot)
+                    roster_shrunk = True
+                    if debug:
+                        print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) second yellow! Away now has {len(away_active_list)} players")
+
     return {
         "home_goals": home_goals,
         "away_goals": away_goals,
-        "bookings_with_minutes": bookings_with_minutes,
-        "send_offs": send_offs,
+        "bookings_with_minutes": _rows_to_dicts(booking_rows, BOOKING_COLUMNS),
+        "send_offs": _rows_to_dicts(send_off_rows, SEND_OFF_COLUMNS),
         "substitutions": applied_substitutions,  # NEW: Return substitution events
         "match_abandoned": match_abandoned,
         "abandonment_reason": abandonment_reason,
         "abandonment_minute": abandonment_minute,
         "final_active_players": {
-            "home": list(home_active),
-            "away": list(away_active)
+            "home": [home_ids[slot] for slot in home_active_list],
+            "away": [away_ids[slot] for slot in away_active_list]
         }
     }
 
@@ -759,58 +998,128 @@ async def simulate_minute_based_events_with_substitutions_async(
 # HELPER FUNCTIONS FOR SUBSTITUTION SYSTEM
 # =========================================
 
-async def create_or_update_suspension(db: AsyncSession, player_id: int, matches: int, reason: str):
+async def create_or_update_suspensions_bulk(
+    db: AsyncSession, entries: List[Tuple[int, int, str]], now: Optional[datetime] = None
+) -> None:
     """
-    Creates a new Suspension or adds matches onto an existing one.
+    For each (player_id, matches, reason): create a new Suspension or add
+    matches onto the existing one. Existing rows are fetched in ONE query;
+    does NOT commit (the match simulation commits once at the end).
+    `now` stamps updated_at (defaults to utcnow).
+    Not an ON CONFLICT upsert: Suspension.player_id has no unique constraint,
+    and create_all would not add one to existing databases.
     """
+    if not entries:
+        return
+
     result = await db.execute(
-        select(Suspension).where(Suspension.player_id == player_id)
+        select(Suspension).where(Suspension.player_id.in_([player_id for player_id, _, _ in entries]))
     )
-    existing = result.scalars().first()
-
-    if existing:
-        existing.matches_remaining = max(0, existing.matches_remaining) + max(0, matches)
-        existing.total_matches_suspended += max(0, matches)
-        existing.reason = reason
-        existing.updated_at = datetime.utcnow()
-        db.add(existing)
-    else:
-        sus = Suspension(
-            player_id=player_id,
-            reason=reason,
-            matches_remaining=max(0, matches),
-            total_matches_suspended=max(0, matches)
-        )
-        db.add(sus)
+    existing_by_player = {sus.player_id: sus for sus in result.scalars().all()}
 
-    await db.commit()
+    now = now or datetime.utcnow()
+    for player_id, matches, reason in entries:
+        existing = existing_by_player.get(player_id)
+        if existing:
+            existing.matches_remaining = max(0, existing.matches_remaining) + max(0, matches)
+            existing.total_matches_suspended += max(0, matches)
+            existing.reason = reason
+            existing.updated_at = now
+        else:
+            sus = Suspension(
+                player_id=player_id,
+                reason=reason,
+                matches_remaining=max(0, matches),
+                total_matches_suspended=max(0, matches)
+            )
+            db.add(sus)
+            existing_by_player[player_id] = sus
 
 
-async def decrement_suspensions_after_match(db: AsyncSession, home_club_id: int, away_club_id: int) -> None:
+def suspension_decrement_stmt(
+    home_club_id: int,
+    away_club_id: int,
+    newly_suspended_players: Set[int] = frozenset(),
+    now: Optional[datetime] = None
+):
     """
-    Decrements matches_remaining for all players with active suspensions
-    in either the home or away club for the just-played match.
+    Builds the ONE UPDATE that decrements matches_remaining for all players with
+    active suspensions in either club of the just-played match. Players suspended
+    in THIS match (newly_suspended_players) are skipped so their countdown starts
+    with the next match. Shared by the async simulator and the sync /simulate route.
     """
-    stmt = (
-        select(Suspension)
-        .join(Player, Player.id == Suspension.player_id)
+    return (
+        update(Suspension)
         .where(
-            Player.club_id.in_([home_club_id, away_club_id]),
-            Suspension.matches_remaining > 0
+            Suspension.player_id.in_(
+                select(Player.id).where(Player.club_id.in_([home_club_id, away_club_id]))
+            ),
+            Suspension.matches_remaining > 0,  # so "- 1" never goes below 0
+            Suspension.player_id.not_in(newly_suspended_players),
         )
+        .values(matches_remaining=Suspension.matches_remaining - 1, updated_at=now or datetime.utcnow())
+        .execution_options(synchronize_session="fetch")
     )
-    result = await db.execute(stmt)
-    suspensions = result.scalars().all()
 
-    changed = False
-    for sus in suspensions:
-        sus.matches_remaining = max(0, sus.matches_remaining - 1)
-        sus.updated_at = datetime.utcnow()
-        db.add(sus)
-        changed = True
 
-    if changed:
-        await db.commit()
+async def decrement_suspensions_after_match(
+    db: AsyncSession,
+    home_club_id: int,
+    away_club_id: int,
+    newly_suspended_players: Set[int] = frozenset(),
+    now: Optional[datetime] = None
+) -> None:
+    """
+    Runs suspension_decrement_stmt for the just-played match. Does NOT commit.
+    """
+    await db.execute(suspension_decrement_stmt(home_club_id, away_club_id, newly_suspended_players, now))
+
+
+# =========================================
+# 📅 MATCHDAY: many fixtures, shared bulk prefetch
+# =========================================
+
+async def simulate_matchday(db: AsyncSession, fixture_ids: List[int]) -> List[dict]:
+    """
+    Simulate several fixtures (e.g. a league round) in one coroutine.
+    Fixtures, clubs + stadiums, available players, active injuries, squad
+    selections and scheduled substitutions are loaded in bulk queries up front
+    instead of once per match; each match then runs the normal
+    substitution-aware simulation on that data.
+    Randomness is not batched across the round: every match draws from its
+    own match_rngs(fixture_id) stream, so under a fixed seed a fixture plays
+    out the same whichever round (or simulate_match) it is simulated in.
+    Results are returned in `fixture_ids` order.
+    """
+    fixtures = {
+        fixture.id: fixture
+        for fixture in await _get_fixtures_with_clubs(db, Match.id.in_(fixture_ids))
+    }
+    missing = [fixture_id for fixture_id in fixture_ids if fixture_id not in fixtures]
+    if missing:
+        raise ValueError(f"Fixtures not found: {missing}")
+
+    club_ids = list(
+        {f.home_club_id for f in fixtures.values()} | {f.away_club_id for f in fixtures.values()}
+    )
+    clubs = _clubs_of(fixtures.values())
+    available = await get_available_players_by_club(db, club_ids)
+    rehab_by_player = await _get_active_injuries_by_player(db, Player.club_id.in_(club_ids))
+    selections = await get_squad_selections(db, fixture_ids, club_ids)
+    substitutions = await get_scheduled_substitutions(db, fixture_ids)
+
+    results = []
+    for fixture_id in fixture_ids:
+        results.append(await simulate_match_with_substitutions(
+            db, fixture_id,
+            fixture=fixtures[fixture_id],
+            clubs=clubs,
+            available=available,
+            rehab_by_player=rehab_by_player,
+            selections=selections,
+            substitutions=substitutions[fixture_id]
+        ))
+    return results
 
 
 # =========================================
@@ -4,7 +4,8 @@ from tactera_backend.core.database import init_db, sync_engine, engine
 from tactera_backend.seed.seed_all import seed_all
 from tactera_backend.models.league_model import League
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
+from tactera_backend.core.config import UTC_PLUS_2
 
 # --- Routers ---
 from tactera_backend.core.auth import router as auth_router
@@ -54,10 +55,8 @@ async def start_background_tasks():
     """
     # Daily tick loop (existing)
     async def daily_tick_loop():
-        tz = timezone(timedelta(hours=2))  # ✅ UTC+2
-
         while True:
-            now = datetime.now(tz)  # Current UTC+2 time
+            now = datetime.now(UTC_PLUS_2)  # Current UTC+2 time
             tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
             seconds_until_midnight = (tomorrow - now).total_seconds()
 
@@ -67,7 +66,7 @@ async def start_background_tasks():
             # Process daily tick
             async with AsyncSession(engine) as session:
                 await process_daily_tick(session)
-            print(f"[{datetime.now(tz)}] ✅ Daily tick processed (UTC+2 midnight).")
+            print(f"[{datetime.now(UTC_PLUS_2)}] ✅ Daily tick processed (UTC+2 midnight).")
 
             # Wait 24 hours for next tick
             await asyncio.sleep(86400)
@@ -22,6 +22,7 @@ class Club(SQLModel, table=True):
     manager: Optional["Manager"] = Relationship(back_populates="club")
     league: Optional["League"] = Relationship(back_populates="clubs")
     training_ground: Optional["TrainingGround"] = Relationship(back_populates="club")
+    stadium: Optional["Stadium"] = Relationship(sa_relationship_kwargs={"uselist": False})  # One stadium per club
     
     formations: List["ClubFormation"] = Relationship(back_populates="club")
 
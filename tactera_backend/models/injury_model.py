@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field, Relationship  # ✅ add Relationship here
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
+from sqlalchemy import Index, text
 from tactera_backend.models.suspension_model import Suspension
 
 
@@ -9,6 +10,19 @@ if TYPE_CHECKING:
 
 class Injury(SQLModel, table=True):
     """Tracks player injuries, their recovery progress, and match availability."""
+    # Partial index: only active injuries (days_remaining > 0) are indexed, so the
+    # "who is injured right now?" lookups stay small and index-only
+    # (days_remaining is a key column too, so SQLite treats the index as covering)
+    __table_args__ = (
+        Index(
+            "ix_injury_active_player",
+            "player_id",
+            "days_remaining",
+            sqlite_where=text("days_remaining > 0"),
+            postgresql_where=text("days_remaining > 0"),
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: int = Field(foreign_key="player.id")
     name: str  # Injury name (e.g., "Hamstring Strain")
@@ -1,9 +1,13 @@
 # match_model.py
 # Defines the Match model (fixtures and results) and MatchResult model (simulated stats)
 
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from datetime import datetime
-from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from sqlmodel import SQLModel, Field, Relationship
+
+if TYPE_CHECKING:
+    from .club_model import Club
 
 
 class Match(SQLModel, table=True):
@@ -11,6 +15,11 @@ class Match(SQLModel, table=True):
     Represents a scheduled match (fixture) between two clubs in a league.
     Linked to a specific season and round.
     """
+    # Fixture/round lookups filter on league + season (+ round)
+    __table_args__ = (
+        Index("ix_match_league_season_round", "league_id", "season_id", "round_number"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # Foreign keys
@@ -28,6 +37,10 @@ class Match(SQLModel, table=True):
     away_goals: Optional[int] = None
     is_played: bool = False                                # Flag if match has been simulated
 
+    # Both clubs (two FKs to club, so each relationship names its own column)
+    home_club: Optional["Club"] = Relationship(sa_relationship_kwargs={"foreign_keys": "[Match.home_club_id]"})
+    away_club: Optional["Club"] = Relationship(sa_relationship_kwargs={"foreign_keys": "[Match.away_club_id]"})
+
 
 class MatchResult(SQLModel, table=True):
     """
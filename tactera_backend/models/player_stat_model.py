@@ -12,8 +12,8 @@ class PlayerStat(SQLModel, table=True):
     player: Optional["Player"] = Relationship(back_populates="stats")
 
 # Deferred import to avoid circular import issues
+# (Player.stats itself is declared on the Player model)
 from tactera_backend.models.player_model import Player
-Player.stats = Relationship(back_populates="player")
 
 def get_stat_level(xp: int, session) -> int:
     """
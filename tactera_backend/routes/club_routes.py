@@ -3,13 +3,14 @@
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
+from sqlalchemy.orm import joinedload, selectinload
 from tactera_backend.core.database import get_session
 from tactera_backend.models.club_model import Club
 from tactera_backend.models.club_schemas import ClubRegister
 from tactera_backend.models.player_model import Player
 from tactera_backend.models.training_model import TrainingGround, TrainingHistory, TrainingHistoryStat
 from tactera_backend.models.player_stat_model import PlayerStat, get_stat_level
-from tactera_backend.services.training import calculate_training_xp, split_xp_among_stats, DRILLS
+from tactera_backend.services.training import calculate_training_xp, split_xp_among_stats, DRILLS, get_drill_by_name
 from datetime import datetime, date
 from pydantic import BaseModel
 from tactera_backend.core.config import TEST_MODE  # Import TEST_MODE for cooldown logic
@@ -101,13 +102,22 @@ def train_club(club_id: int, data: TrainingRequest, session: Session = Depends(g
     """
     print("Training club:", club_id)
 
-    # ✅ Fetch the club and validate existence
-    club = session.get(Club, club_id)
+    # ✅ Fetch the club with training ground, squad, stats and injuries eager-loaded
+    # (one joined query + selectin batches instead of per-player round trips)
+    club = session.exec(
+        select(Club)
+        .where(Club.id == club_id)
+        .options(
+            joinedload(Club.training_ground),
+            selectinload(Club.squad).selectinload(Player.stats),
+            selectinload(Club.squad).selectinload(Player.injuries),
+        )
+    ).first()
     if not club:
         raise HTTPException(status_code=404, detail="Club not found.")
 
     # ✅ Get training ground
-    training_ground = session.get(TrainingGround, club.trainingground_id)
+    training_ground = club.training_ground
     if not training_ground:
         raise HTTPException(status_code=404, detail="Training ground not found.")
 
@@ -119,22 +129,37 @@ def train_club(club_id: int, data: TrainingRequest, session: Session = Depends(g
             raise HTTPException(status_code=403, detail="This club has already trained today.")
 
 
-    # ✅ Fetch players
-    players = session.exec(select(Player).where(Player.club_id == club_id)).all()
+    # ✅ Players (already loaded with the club)
+    players = club.squad
     if not players:
         raise HTTPException(status_code=404, detail="No players found for this club.")
 
     # ✅ Validate chosen drill
-    drill = next((d for d in DRILLS if d["name"].lower() == data.drill_name.lower()), None)
-    if not drill:
+    try:
+        drill = get_drill_by_name(data.drill_name)
+    except ValueError:
         raise HTTPException(status_code=400, detail="Invalid drill selected.")
 
     # ✅ Injury-aware training
-    from tactera_backend.services.training import apply_training_with_injury_check
+    from tactera_backend.services.training import (
+        apply_training_with_injury_check, calculate_squad_training_xp, draw_squad_stat_weights
+    )
     updated_players = []
 
-    for player in players:
-        result = apply_training_with_injury_check(player, drill, session)
+    # ✅ Base XP for the whole squad in one vectorized pass
+    squad_xp = calculate_squad_training_xp(
+        [p.potential for p in players],
+        [p.ambition for p in players],
+        [p.consistency for p in players],
+        training_ground.xp_boost
+    )
+
+    squad_weights = draw_squad_stat_weights(len(players), drill)
+
+    for player, base_xp, stat_weights in zip(players, squad_xp, squad_weights):
+        result = apply_training_with_injury_check(
+            player, drill, session, training_ground, float(base_xp), stat_weights
+        )
         updated_players.append(result)
     
         # ✅ Build summary counts based on status_flag
@@ -65,8 +65,7 @@ async def set_club_training_intensity(
     # TODO (future): enforce 'hard' lock behind physio department >= 1
     club.training_intensity = intensity
     db.add(club)
-    await db.commit()
-    await db.refresh(club)
+    await db.commit()  # No refresh: sessions don't expire on commit
 
     return {
         "club_id": club_id,
@@ -288,8 +287,7 @@ async def debug_create_match_squad(
     )
     
     db.add(match_squad)
-    await db.commit()
-    await db.refresh(match_squad)
+    await db.commit()  # No refresh: the id is set at flush and sessions don't expire on commit
     
     return {
         "message": "Match squad created successfully",
@@ -361,8 +359,7 @@ async def debug_make_test_substitution(
     match_squad.players_substituted += 1
     db.add(match_squad)
     
-    await db.commit()
-    await db.refresh(substitution)
+    await db.commit()  # No refresh: the id is set at flush and sessions don't expire on commit
     
     return {
         "success": True,
@@ -639,8 +636,7 @@ async def debug_create_match_squad(
     )
     
     db.add(match_squad)
-    await db.commit()
-    await db.refresh(match_squad)
+    await db.commit()  # No refresh: the id is set at flush and sessions don't expire on commit
     
     return {
         "message": "Match squad created successfully",
@@ -712,8 +708,7 @@ async def debug_make_test_substitution(
     match_squad.players_substituted += 1
     db.add(match_squad)
     
-    await db.commit()
-    await db.refresh(substitution)
+    await db.commit()  # No refresh: the id is set at flush and sessions don't expire on commit
     
     return {
         "success": True,
@@ -870,11 +865,11 @@ def debug_create_contracts(session: Session = Depends(get_session)):
     from datetime import date, timedelta
     import random
     
-    # Get all players without contracts
+    # Get all players without contracts (LEFT OUTER JOIN, keep rows with no contract)
     players_without_contracts = session.exec(
-        select(Player).where(
-            ~Player.id.in_(select(PlayerContract.player_id))
-        )
+        select(Player)
+        .outerjoin(PlayerContract, PlayerContract.player_id == Player.id)
+        .where(PlayerContract.id == None)
     ).all()
     
     contracts_created = 0
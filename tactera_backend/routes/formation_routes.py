@@ -2,6 +2,7 @@
 # API routes for formation and lineup management
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import joinedload
 from sqlmodel import Session, select
 from typing import List, Dict, Any
 from tactera_backend.core.database import get_session
@@ -45,9 +46,11 @@ def get_club_formation(club_id: int, session: Session = Depends(get_session)):
     if not club:
         raise HTTPException(status_code=404, detail="Club not found")
     
-    # 2. Get the club's active formation
+    # 2. Get the club's active formation (template loaded in the same query)
     club_formation = session.exec(
-        select(ClubFormation).where(
+        select(ClubFormation)
+        .options(joinedload(ClubFormation.template))
+        .where(
             ClubFormation.club_id == club_id,
             ClubFormation.is_active == True
         )
@@ -62,8 +65,8 @@ def get_club_formation(club_id: int, session: Session = Depends(get_session)):
             "message": "No formation set for this club"
         }
     
-    # 3. Get the formation template details
-    template = session.get(FormationTemplate, club_formation.formation_template_id)
+    # 3. Formation template details (already loaded with the formation)
+    template = club_formation.template
     
     # 4. Get player details for assigned positions
     assigned_players = {}
@@ -190,9 +193,11 @@ def assign_player_to_position(
     if not player or player.club_id != club_id:
         raise HTTPException(status_code=404, detail="Player not found or doesn't belong to this club")
     
-    # 3. Get the club's formation
+    # 3. Get the club's formation (template loaded in the same query)
     club_formation = session.exec(
-        select(ClubFormation).where(
+        select(ClubFormation)
+        .options(joinedload(ClubFormation.template))
+        .where(
             ClubFormation.club_id == club_id,
             ClubFormation.is_active == True
         )
@@ -202,7 +207,7 @@ def assign_player_to_position(
         raise HTTPException(status_code=400, detail="Club has no formation set. Set a formation template first.")
     
     # 4. Verify position exists in the formation template
-    template = session.get(FormationTemplate, club_formation.formation_template_id)
+    template = club_formation.template
     if not template or position not in template.positions:
         raise HTTPException(status_code=400, detail=f"Position '{position}' not found in current formation")
     
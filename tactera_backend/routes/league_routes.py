@@ -7,8 +7,9 @@ from tactera_backend.models.match_model import Match
 from tactera_backend.models.season_model import Season, SeasonState
 from tactera_backend.services.generate_fixtures import generate_fixtures_for_league
 from tactera_backend.core.database import get_db
-from tactera_backend.core.match_sim import simulate_match
+from tactera_backend.core.match_sim import simulate_match, simulate_matchday
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from tactera_backend.models.player_model import Player
 from tactera_backend.core.injury_config import LOW_ENERGY_THRESHOLD
 from tactera_backend.models.suspension_model import Suspension
@@ -132,6 +133,7 @@ def get_fixtures(league_id: int, session: Session = Depends(get_session)):
     # Fetch fixtures for this league and season
     fixtures = session.exec(
         select(Match)
+        .options(joinedload(Match.home_club), joinedload(Match.away_club))
         .where(Match.league_id == league_id, Match.season_id == season.id)
         .order_by(Match.round_number, Match.match_time)
     ).all()
@@ -139,9 +141,9 @@ def get_fixtures(league_id: int, session: Session = Depends(get_session)):
     # Build a lightweight, frontend-friendly payload
     fixtures_payload = []
     for fx in fixtures:
-        # Fetch club names for convenience (frontend can show them directly)
-        home_club = session.get(Club, fx.home_club_id)
-        away_club = session.get(Club, fx.away_club_id)
+        # Club names for convenience (frontend can show them directly); joined in above
+        home_club = fx.home_club
+        away_club = fx.away_club
 
         # Compute availability summaries for each side
         home_avail = compute_availability_counts(session, fx.home_club_id)
@@ -341,11 +343,8 @@ async def simulate_round_endpoint(league_id: int, db: AsyncSession = Depends(get
             "results": []
         }
 
-    # 4. Simulate matches
-    results = []
-    for match in matches:
-        result = await simulate_match(db, match.id)
-        results.append(result)
+    # 4. Simulate matches (shared bulk prefetch for the whole round)
+    results = await simulate_matchday(db, [match.id for match in matches])
 
     # 5. Advance round or complete season
     if season_state.current_round < final_round:
@@ -372,14 +371,16 @@ def get_fixture_availability(fixture_id: int, session: Session = Depends(get_ses
     - availability_status: "injured" | "rehab" | "tired" | "suspended" | "ok"
     - a minimal active_injury summary if present
     """
-    # 1) Load the fixture
-    fixture = session.get(Match, fixture_id)
+    # 1) Load the fixture with both clubs in one query
+    fixture = session.get(
+        Match, fixture_id, options=[joinedload(Match.home_club), joinedload(Match.away_club)]
+    )
     if not fixture:
         raise HTTPException(status_code=404, detail="Fixture not found")
 
     # 2) Resolve clubs (nice for response)
-    home_club = session.get(Club, fixture.home_club_id) if fixture.home_club_id else None
-    away_club = session.get(Club, fixture.away_club_id) if fixture.away_club_id else None
+    home_club = fixture.home_club
+    away_club = fixture.away_club
 
     # 3) Load both squads
     home_players = session.exec(select(Player).where(Player.club_id == fixture.home_club_id)).all()
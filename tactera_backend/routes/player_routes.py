@@ -3,9 +3,10 @@ from sqlmodel import Session, select
 from tactera_backend.core.database import get_session, get_db
 from tactera_backend.models.training_model import TrainingHistory, TrainingHistoryStat
 from tactera_backend.models.player_model import Player
+from tactera_backend.models.player_stat_model import PlayerStat
 from tactera_backend.models.stat_level_requirement_model import StatLevelRequirement
 from tactera_backend.services.xp_helper import calculate_level_from_xp, add_xp_to_stat
-from typing import Optional
+from typing import Optional, List
 from tactera_backend.services.injury_service import tick_injuries
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -105,6 +106,31 @@ def get_player_stat_summary(player_id: int, session: Session = Depends(get_sessi
     }
     return {"player_id": player_id, "stats": summary}
 
+# ============================================
+# Core: Batch stat summary (squad / leaderboard views)
+# ============================================
+@router.get("/players/stat-summary")
+def get_players_stat_summary(
+    ids: List[int] = Query(..., description="Player IDs, e.g. ?ids=1&ids=2&ids=3"),
+    session: Session = Depends(get_session)
+):
+    """
+    📊 Returns XP and level for every tracked stat of many players at once.
+    One DB round-trip for all players instead of one request per player.
+    Example: /players/stat-summary?ids=1&ids=2&ids=3
+    """
+    stats = session.exec(
+        select(PlayerStat).where(PlayerStat.player_id.in_(ids))
+    ).all()
+
+    summaries = {player_id: {} for player_id in ids}
+    for stat in stats:
+        summaries[stat.player_id][stat.stat_name] = {
+            "xp": stat.xp,
+            "level": calculate_level_from_xp(stat.xp, session)
+        }
+    return summaries
+
 # ============================================
 # Core: Player stat levels
 # ============================================
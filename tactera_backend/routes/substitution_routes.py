@@ -98,6 +98,7 @@ def validate_substitution_request(
     
     # Current players on pitch = starting XI - substituted off + substituted on
     current_on_pitch = set(match_squad.starting_xi) - substituted_off | substituted_on
+    selected_players = set(match_squad.selected_players)  # Membership checked once per change
     
     # 5. Validate each player change
     for change in substitution_request.player_changes:
@@ -116,7 +117,7 @@ def validate_substitution_request(
             errors.append(f"Player {player_off} has already been substituted off")
         
         # Check player being substituted on
-        if player_on not in match_squad.selected_players:
+        if player_on not in selected_players:
             errors.append(f"Player {player_on} is not in the match squad")
         
         if player_on in current_on_pitch:
@@ -350,6 +351,28 @@ def get_available_substitutes(
     ).all()
     
     player_dict = {p.id: p for p in players}
+
+    # Bench availability: injuries + suspensions for every bench player in two IN queries
+    bench_ids = list(bench_players)
+    injury_by_player = {
+        injury.player_id: injury
+        for injury in session.exec(
+            select(Injury).where(
+                Injury.player_id.in_(bench_ids),
+                Injury.days_remaining > 0,
+                Injury.fit_for_matches == False
+            )
+        ).all()
+    } if bench_ids else {}
+    suspension_by_player = {
+        suspension.player_id: suspension
+        for suspension in session.exec(
+            select(Suspension).where(
+                Suspension.player_id.in_(bench_ids),
+                Suspension.matches_remaining > 0
+            )
+        ).all()
+    } if bench_ids else {}
     
     # 5. Build response
     on_pitch = []
@@ -375,25 +398,14 @@ def get_available_substitutes(
             unavailable_reason = None
             
             # Check injury
-            active_injury = session.exec(
-                select(Injury).where(
-                    Injury.player_id == player_id,
-                    Injury.days_remaining > 0,
-                    Injury.fit_for_matches == False
-                )
-            ).first()
+            active_injury = injury_by_player.get(player_id)
             
             if active_injury:
                 can_substitute = False
                 unavailable_reason = f"Injured: {active_injury.name}"
             
             # Check suspension
-            active_suspension = session.exec(
-                select(Suspension).where(
-                    Suspension.player_id == player_id,
-                    Suspension.matches_remaining > 0
-                )
-            ).first()
+            active_suspension = suspension_by_player.get(player_id)
             
             if active_suspension:
                 can_substitute = False
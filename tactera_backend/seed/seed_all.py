@@ -11,8 +11,8 @@ from tactera_backend.seed.seed_xp_levels import seed_xp_levels
 from tactera_backend.seed.seed_season import seed_seasons
 from tactera_backend.services.generate_fixtures import generate_fixtures_for_league
 from tactera_backend.seed.seed_formations import seed_formation_templates
-from sqlmodel import Session, select
-from tactera_backend.core.database import sync_engine
+from sqlmodel import select
+from tactera_backend.core.database import bulk_write_session
 from tactera_backend.models.league_model import League
 
 def seed_all():
@@ -47,7 +47,7 @@ def seed_all():
 
     print("➡️  Step 10: Generating fixtures for active leagues only...")
 
-    with Session(sync_engine) as session:
+    with bulk_write_session() as session:
         # ✅ ONLY generate fixtures for active leagues
         active_leagues = session.exec(select(League).where(League.is_active == True)).all()
         print(f"🎯 Found {len(active_leagues)} active leagues for fixture generation")
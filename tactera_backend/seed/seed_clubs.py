@@ -13,7 +13,7 @@ from tactera_backend.models.league_model import League
 from tactera_backend.models.training_model import TrainingGround
 import random
 from tactera_backend.models.country_model import Country
-from tactera_backend.core.league_config import league_config
+from tactera_backend.core.league_config import TIER1_TEAMS, REPUTATION_TIER
 
 
 def seed_clubs():
@@ -47,26 +47,16 @@ def seed_clubs():
                 select(func.count()).select_from(Club).where(Club.league_id == league.id)
             ).one()
 
+            # Find the country for this league (once per league)
+            country = session.exec(
+                select(Country).where(Country.id == league.country_id)
+            ).first()
+            country_name = country.name if country else None
+
             # Determine target based on league level
             if league.level == 1:
-                # Tier 1: Check country system from league config
-                from tactera_backend.core.league_config import league_config
-                
-                # Find the country for this league
-                country = session.exec(
-                    select(Country).where(Country.id == league.country_id)
-                ).first()
-                
-                if country and country.name in league_config:
-                    country_config = league_config[country.name]
-                    # Find the tier 1 league config
-                    tier1_leagues = [l for l in country_config["leagues"] if l["level"] == 1]
-                    if tier1_leagues:
-                        desired_club_count = tier1_leagues[0]["teams"]
-                    else:
-                        desired_club_count = 16  # fallback
-                else:
-                    desired_club_count = 16  # fallback
+                # Tier 1: size comes from the country system in league config
+                desired_club_count = TIER1_TEAMS.get(country_name, 16)  # 16 = fallback
             else:
                 # Tier 2+: Use 14 or 16 based on system
                 desired_club_count = 14  # Most tier 2 leagues use 14
@@ -80,28 +70,18 @@ def seed_clubs():
                 # Create clubs for this league
                 for i in range(clubs_needed):
                     # Calculate starting money based on league reputation
-
-                    # Find country for this league
-                    country = session.exec(
-                        select(Country).where(Country.id == league.country_id)
-                    ).first()
-
-                    # Set starting money based on league reputation
-                    if country and country.name in league_config:
-                        country_config = league_config[country.name]
-                        reputation = country_config.get("reputation", 70)
-                        
-                        # Higher reputation leagues = more money
-                        if reputation >= 90:
-                            starting_money = 200000  # Elite leagues (Germany, Spain, etc.)
-                        elif reputation >= 80:
-                            starting_money = 150000  # Strong leagues (France, Netherlands)
-                        elif reputation >= 70:
-                            starting_money = 100000  # Good leagues (Denmark, Portugal)
-                        else:
-                            starting_money = 75000   # Average leagues (Sweden, Norway)
-                    else:
+                    # Higher reputation leagues = more money
+                    tier = REPUTATION_TIER.get(country_name)
+                    if tier is None:
                         starting_money = 100000  # Default fallback
+                    elif tier == "elite":
+                        starting_money = 200000  # Elite leagues (Germany, Spain, etc.)
+                    elif tier == "strong":
+                        starting_money = 150000  # Strong leagues (France, Netherlands)
+                    elif tier == "good":
+                        starting_money = 100000  # Good leagues (Denmark, Portugal)
+                    else:
+                        starting_money = 75000   # Average leagues (Sweden, Norway)
 
                     bot_club = Club(
                         name=f"Bot Club {league.id}-{i+1}",
@@ -41,8 +41,7 @@ def seed_leagues():
                 print(f"➕ Adding new country: {country_name}")
                 country = Country(name=country_name)
                 session.add(country)
-                session.commit()
-                session.refresh(country)
+                session.flush()  # Assigns country.id; committed once at the end
 
             # Loop through leagues in this country
             for league_data in country_data["leagues"]:
@@ -69,6 +68,7 @@ def seed_leagues():
 
 
 
+        session.commit()
         print("✅ League seeding complete!")
 
 
@@ -90,7 +90,6 @@ def _add_league_if_missing(session: Session, name: str, level: int, country_id:
         if existing_league.is_active != is_active:
             existing_league.is_active = is_active
             session.add(existing_league)
-            session.commit()
             print(f"   🔄 Updated {name} active status to {is_active}")
         else:
             print(f"   🔁 League already exists: {name}")
@@ -105,5 +104,4 @@ def _add_league_if_missing(session: Session, name: str, level: int, country_id:
         group=group,
         is_active=is_active
     )
-    session.add(league)
-    session.commit()
\ No newline at end of file
+    session.add(league)  # Committed by seed_leagues() once all leagues are added
\ No newline at end of file
@@ -52,11 +52,9 @@ def seed_stadiums():
         if new_stadiums:
             print(f"🚀 Batch creating {len(new_stadiums)} stadiums...")
             session.add_all(new_stadiums)
-            session.commit()
 
-            # Refresh stadiums to get their IDs
-            for stadium in new_stadiums:
-                session.refresh(stadium)
+            # Flush (not commit) to get stadium IDs without an extra fsync
+            session.flush()
 
             # ✅ Create stadium parts for all new stadiums
             print(f"🏗️ Creating stadium parts for {len(new_stadiums)} stadiums...")
@@ -71,7 +69,7 @@ def seed_stadiums():
                     )
                     new_stadium_parts.append(part)
 
-            # ✅ Batch insert all stadium parts
+            # ✅ Batch insert all stadium parts, single commit for stadiums + parts
             session.add_all(new_stadium_parts)
             session.commit()
 
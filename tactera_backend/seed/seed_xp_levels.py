@@ -6,6 +6,7 @@ import os
 from sqlmodel import Session
 from tactera_backend.core.database import sync_engine
 from tactera_backend.models.stat_level_requirement_model import StatLevelRequirement
+from tactera_backend.services.xp_helper import invalidate_level_table
 
 def seed_xp_levels():
     """
@@ -104,6 +105,7 @@ def seed_xp_levels():
 
             # Commit all changes
             session.commit()
+            invalidate_level_table()
             
             print(f"✅ XP levels seeded successfully!")
             print(f"   📈 Added: {rows_added} new levels")
@@ -179,6 +181,7 @@ def seed_xp_levels_programmatic():
             rows_added += 1
 
         session.commit()
+        invalidate_level_table()
         print(f"✅ Programmatic XP levels seeded: {rows_added} new levels (1-250)")
         print("⚠️  Note: This is an approximation. For exact values, ensure CSV loading works.")
 
@@ -149,7 +149,9 @@ def get_club_finances(session: Session, club_id: int) -> dict:
         "financial_status": "healthy" if days_until_bankruptcy > 30 else "warning" if days_until_bankruptcy > 7 else "critical"
     }
     
-def calculate_match_revenue(session: Session, home_club_id: int, attendance_percentage: float = 0.75) -> dict:
+def calculate_match_revenue(
+    session: Session, home_club_id: int, attendance_percentage: float = 0.75, stadium=None
+) -> dict:
     """
     Calculate match revenue for the home club based on stadium capacity.
     
@@ -157,21 +159,24 @@ def calculate_match_revenue(session: Session, home_club_id: int, attendance_perc
         session: Database session
         home_club_id: ID of the home club
         attendance_percentage: Percentage of stadium filled (0.0 to 1.0)
+        stadium: Optional home Stadium already loaded by the caller (e.g. the
+            match simulation); skips the club and stadium lookups
     
     Returns:
         dict with revenue details
     """
     from tactera_backend.models.stadium_model import Stadium
     
-    # Get home club
-    club = session.get(Club, home_club_id)
-    if not club:
-        return {"success": False, "message": "Club not found"}
-    
-    # Get home stadium
-    stadium = session.exec(
-        select(Stadium).where(Stadium.club_id == home_club_id)
-    ).first()
+    if stadium is None:
+        # Get home club
+        club = session.get(Club, home_club_id)
+        if not club:
+            return {"success": False, "message": "Club not found"}
+        
+        # Get home stadium
+        stadium = session.exec(
+            select(Stadium).where(Stadium.club_id == home_club_id)
+        ).first()
     
     if not stadium:
         return {"success": False, "message": "Stadium not found"}
@@ -2,6 +2,9 @@
 # Service for generating league fixtures (double round-robin) tied to an active season.
 
 from datetime import datetime, timedelta
+from typing import List
+import numpy as np
+from sqlalchemy import delete
 from sqlmodel import Session, select
 from tactera_backend.models.league_model import League
 from tactera_backend.models.club_model import Club
@@ -9,6 +12,53 @@ from tactera_backend.models.match_model import Match
 from tactera_backend.models.season_model import Season, SeasonState
 
 
+def generate_double_round_robin(club_ids: List[int]) -> np.ndarray:
+    """
+    Builds a double round-robin schedule using the "circle method".
+    - Club 0 stays fixed, the others rotate one slot per round
+    - Every club plays exactly once per round (a bye if the count is odd)
+    - The fixed club alternates home/away so its home games are spread out
+    - The second half of the season mirrors the first with home/away swapped
+    Returns an (n_matches, 3) int32 array of (round_number, home_id, away_id),
+    ordered by round. Rounds are numbered from 1.
+    """
+    ids = np.asarray(club_ids, dtype=np.int32)
+    n = len(ids) + len(ids) % 2  # Add a dummy "bye" slot if odd number of clubs
+    half = n // 2
+    rounds = np.arange(n - 1)[:, None]  # (n-1, 1)
+
+    # Slot positions paired each round: 0 vs n-1, 1 vs n-2, ...
+    home_pos = np.arange(half)[None, :]
+    away_pos = n - 1 - home_pos
+
+    # Club index sitting in a slot after r rotations (slot 0 never moves)
+    def club_at(pos):
+        return np.where(pos == 0, 0, 1 + (pos - 1 - rounds) % (n - 1))
+
+    home = np.broadcast_to(club_at(home_pos), (n - 1, half)).copy()
+    away = club_at(away_pos)
+
+    # Fixed club plays away on odd rounds
+    odd = rounds[:, 0] % 2 == 1
+    home[odd, 0], away[odd, 0] = away[odd, 0], home[odd, 0].copy()
+
+    round_numbers = np.broadcast_to(rounds + 1, (n - 1, half))
+    first_leg = np.stack([round_numbers, home, away], axis=-1).reshape(-1, 3)
+    first_leg = first_leg[(first_leg[:, 1] < len(ids)) & (first_leg[:, 2] < len(ids))]  # Skip bye pairings
+
+    second_leg = first_leg[:, [0, 2, 1]]
+    second_leg[:, 0] += n - 1
+
+    schedule = np.concatenate([first_leg, second_leg]).astype(np.int32)
+    schedule[:, 1:] = ids[schedule[:, 1:]]
+    return schedule
+
+
+# Rows per executemany when inserting fixtures (keeps statement batches
+# bounded for multi-group leagues)
+FIXTURE_INSERT_CHUNK = 500
+
+
 def generate_fixtures_for_league(session: Session, league_id: int):
     """
     Generates fixtures for the active season of a given league.
@@ -39,57 +89,15 @@ def generate_fixtures_for_league(session: Session, league_id: int):
         raise ValueError(f"Not enough clubs in {league.name} to generate fixtures.")
 
     # ✅ Clear existing fixtures for this league + season (if any)
-    existing_fixtures = session.exec(
-        select(Match).where(Match.league_id == league.id, Match.season_id == season.id)
-    ).all()
-    for match in existing_fixtures:
-        session.delete(match)
-    session.commit()
+    # Committed together with the new fixtures below (one transaction).
+    session.exec(
+        delete(Match).where(Match.league_id == league.id, Match.season_id == season.id)
+    )
 
     # =====================================
     # ROUND-ROBIN FIXTURE GENERATION
     # =====================================
-    # Algorithm: "Circle Method" for round-robin scheduling
-    club_ids = [club.id for club in clubs]
-    if len(club_ids) % 2 != 0:
-        club_ids.append(None)  # Add a dummy "bye" if odd number of clubs
-
-    num_rounds = (len(club_ids) - 1) * 2  # Double round-robin
-    half = len(club_ids) // 2
-
-    fixtures = []  # Collect fixtures before saving
-    round_number = 1
-
-    for cycle in range(2):  # Two cycles (home/away)
-        rotated = club_ids[:]
-        for r in range(len(club_ids) - 1):  # Each round in this cycle
-            round_fixtures = []
-            for i in range(half):
-                home = rotated[i]
-                away = rotated[-i - 1]
-
-                if home is None or away is None:
-                    continue  # Skip bye rounds
-
-                # Swap home/away in second cycle
-                if cycle == 1:
-                    home, away = away, home
-
-                round_fixtures.append((home, away))
-
-            # Rotate clubs (keep the first club fixed)
-            rotated = [rotated[0]] + [rotated[-1]] + rotated[1:-1]
-
-            # Append fixtures for this round
-            for home_id, away_id in round_fixtures:
-                fixtures.append({
-                    "league_id": league.id,
-                    "season_id": season.id,
-                    "round_number": round_number,
-                    "home_club_id": home_id,
-                    "away_club_id": away_id,
-                })
-            round_number += 1
+    schedule = generate_double_round_robin([club.id for club in clubs])
 
     # =====================================
     # ASSIGN MATCH DATES
@@ -100,8 +108,9 @@ def generate_fixtures_for_league(session: Session, league_id: int):
 
     current_date = season.start_date
     match_index = 0
+    match_rows = []  # Plain dicts, inserted in one batch below
 
-    for round_data in fixtures:
+    for round_number, home_id, away_id in schedule.tolist():
         weekday = matchdays[(match_index // 2) % len(matchdays)]  # Rotate through Tue/Thu/Sat/Sun
 
         # Advance to the correct weekday
@@ -115,17 +124,21 @@ def generate_fixtures_for_league(session: Session, league_id: int):
             match_time = current_date.replace(hour=pm_time[0], minute=pm_time[1])
             current_date += timedelta(days=1)  # After PM, next day
 
-        # Create match entry
-        match = Match(
-            league_id=round_data["league_id"],
-            season_id=round_data["season_id"],
-            round_number=round_data["round_number"],
-            home_club_id=round_data["home_club_id"],
-            away_club_id=round_data["away_club_id"],
-            match_time=match_time
-        )
-        session.add(match)
+        # Queue match entry
+        match_rows.append({
+            "league_id": league.id,
+            "season_id": season.id,
+            "round_number": round_number,
+            "home_club_id": home_id,
+            "away_club_id": away_id,
+            "match_time": match_time,
+            "is_played": False,
+        })
         match_index += 1
 
+    # ✅ Core executemany INSERTs in chunks (no per-Match ORM objects)
+    insert_match = Match.__table__.insert()
+    for start in range(0, len(match_rows), FIXTURE_INSERT_CHUNK):
+        session.execute(insert_match, match_rows[start:start + FIXTURE_INSERT_CHUNK])
     session.commit()
-    print(f"✅ Fixtures generated for {league.name}, Season {season.season_number} ({len(fixtures)} matches total)")
+    print(f"✅ Fixtures generated for {league.name}, Season {season.season_number} ({len(match_rows)} matches total)")
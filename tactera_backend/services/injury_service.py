@@ -1,52 +1,58 @@
 from sqlmodel import select, Session
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from tactera_backend.models.injury_model import Injury
+from tactera_backend.core.config import TEST_MODE, UTC_PLUS_2
 
 async def tick_injuries(db: AsyncSession):
     """
     Decrement injury days_remaining daily and update rehab/fitness.
+    Log lines are buffered and printed once after the commit (TEST_MODE only).
     """
+    # TEST_MODE is a process-level constant: read it once into a local for the loop
+    debug = TEST_MODE
+
     result = await db.execute(select(Injury).where(Injury.days_remaining > 0))
     injuries = result.scalars().all()
-    tz = timezone(timedelta(hours=2))
-    
-    result = await db.execute(select(Injury).where(Injury.days_remaining > 0))
-    injuries = result.scalars().all()
+    stamp = f"[{datetime.now(UTC_PLUS_2)}]"  # One timestamp for the whole tick
 
     if not injuries:
-        print(f"[{datetime.now(tz)}] 💤 No injuries to update today.")
+        if debug:
+            print(f"{stamp} 💤 No injuries to update today.")
         return {
             "updated_injuries": 0,
             "injuries": []
         }
 
+    log_buffer = []
+    log = log_buffer.append
 
     for injury in injuries:
     # Decrement recovery timer
         injury.days_remaining -= 1
 
-        if injury.days_remaining > 0:
-            print(f"[{datetime.now(tz)}] ⏳ Injury Progress: Player {injury.player_id} - "
+        if injury.days_remaining > 0 and debug:
+            log(f"{stamp} ⏳ Injury Progress: Player {injury.player_id} - "
                 f"{injury.name} ({injury.severity}), {injury.days_remaining} days left.")
 
         # If entering rehab phase
         if injury.days_remaining <= (injury.days_total - injury.rehab_start) and not injury.fit_for_matches:
             injury.fit_for_matches = True
-            print(f"[{datetime.now(tz)}] 🏃 Rehab Started: Player {injury.player_id} is now fit enough for matches.")
+            if debug:
+                log(f"{stamp} 🏃 Rehab Started: Player {injury.player_id} is now fit enough for matches.")
 
         # Fully recovered
         if injury.days_remaining <= 0:
             injury.days_remaining = 0
             injury.fit_for_matches = True
-            print(f"[{datetime.now(tz)}] ✅ Injury Healed: Player {injury.player_id} fully recovered from {injury.name}.")
-
+            if debug:
+                log(f"{stamp} ✅ Injury Healed: Player {injury.player_id} fully recovered from {injury.name}.")
 
-        db.add(injury)
+    await db.commit()  # Loaded injuries are already tracked by the session: no db.add needed
 
-    await db.commit()
-    
-    print(f"[{datetime.now(tz)}] 📊 Daily Injury Tick: {len(injuries)} injuries updated.")
+    if debug:
+        log(f"{stamp} 📊 Daily Injury Tick: {len(injuries)} injuries updated.")
+        print("\n".join(log_buffer))
 
     return {
     "updated_injuries": len(injuries),
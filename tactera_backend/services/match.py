@@ -1,25 +1,35 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import joinedload
 from sqlmodel import Session, select
 from tactera_backend.models.club_model import Club
 from tactera_backend.models.match_model import MatchResult
 from tactera_backend.core.database import get_session
 from tactera_backend.models.player_model import Player
 import random
-from tactera_backend.models.player_stat_model import PlayerStat
+import numpy as np
+from collections import Counter
+from itertools import chain
 from datetime import datetime, timedelta, timezone, date
-from typing import List, Set
+from typing import List, Optional, Set, Tuple
 from tactera_backend.models.suspension_model import Suspension
 
 # --- Injury imports ---
-from tactera_backend.core.injury_generator import calculate_injury_risk, generate_injury
+from tactera_backend.core.injury_generator import calculate_injury_risk, generate_injuries
 from tactera_backend.core.injury_config import REINJURY_MULTIPLIER
-from tactera_backend.models.stadium_model import Stadium
 from tactera_backend.models.injury_model import Injury
-from tactera_backend.core.config import TEST_MODE
+from tactera_backend.core.config import TEST_MODE, VERBOSE_INJURY_LOG, RANDOM_SEED, UTC_PLUS_2
+from tactera_backend.core.match_sim import suspension_decrement_stmt, swap_pop
 
 # ✅ Define router BEFORE using it
 router = APIRouter()
 
+# Module-level RNG for injury rolls (seedable via TACTERA_RANDOM_SEED)
+_rng = random.Random(RANDOM_SEED)
+_random = _rng.random
+
+# NumPy RNG for the pre-drawn booking rolls (seedable via TACTERA_RANDOM_SEED)
+_np_rng = np.random.default_rng(RANDOM_SEED)
+
 # ============================
 # 📌 Reinjury Risk Multiplier
 # ============================
@@ -37,7 +47,9 @@ from tactera_backend.core.injury_config import (
     LOW_ENERGY_MAX_MULTIPLIER
 )
 
-def calculate_reinjury_risk_multiplier(player, session) -> float:
+def calculate_reinjury_risk_multiplier(
+    player, session, prefetched: Optional[Tuple] = None, today: Optional[date] = None
+) -> float:
     """
     Calculate a risk multiplier for a player's injury chance in a match.
 
@@ -51,6 +63,10 @@ def calculate_reinjury_risk_multiplier(player, session) -> float:
     Args:
         player: Player object with at least .id and .energy.
         session: SQLModel session for DB access.
+        prefetched: Optional (active_injury, last_injury) for this player, already
+            loaded by the caller; skips both injury queries below.
+        today: Optional UTC date for the healed-window check (callers scoring a
+            whole squad pass it once instead of reading the clock per player).
 
     Returns:
         float: Multiplier to apply to base injury probability.
@@ -58,16 +74,20 @@ def calculate_reinjury_risk_multiplier(player, session) -> float:
     multiplier = 1.0
 
     # Get today's date for healed window calculations
-    today = datetime.utcnow().date()
+    if today is None:
+        today = datetime.utcnow().date()
 
     # 1) ACTIVE REHAB CHECK
     #    We consider an "active injury" as days_remaining > 0.
     #    Rehab phase starts when days_remaining <= rehab_start.
-    active_injury = session.exec(
-        select(Injury)
-        .where(Injury.player_id == player.id, Injury.days_remaining > 0)
-        .order_by(Injury.start_date.desc())
-    ).first()
+    if prefetched is not None:
+        active_injury, last_injury = prefetched
+    else:
+        active_injury = session.exec(
+            select(Injury)
+            .where(Injury.player_id == player.id, Injury.days_remaining > 0)
+            .order_by(Injury.start_date.desc())
+        ).first()
 
     if active_injury:
         # Player is still injured — check if they are in the rehab segment
@@ -83,11 +103,12 @@ def calculate_reinjury_risk_multiplier(player, session) -> float:
     #    compute healed_date = start_date + days_total. If healed_date is
     #    within RECENT_HEALED_WINDOW_DAYS days before today, apply multiplier.
     if not active_injury:
-        last_injury = session.exec(
-            select(Injury)
-            .where(Injury.player_id == player.id)
-            .order_by(Injury.start_date.desc())
-        ).first()
+        if prefetched is None:
+            last_injury = session.exec(
+                select(Injury)
+                .where(Injury.player_id == player.id)
+                .order_by(Injury.start_date.desc())
+            ).first()
 
         if last_injury and last_injury.start_date and last_injury.days_total:
             try:
@@ -142,113 +163,124 @@ def simulate_minute_based_events(home_players: List[Player], away_players: List[
     - Players sent off (and when)
     - Active players remaining at match end
     """
-    # Track which players are still on the pitch
-    home_active: Set[int] = {p.id for p in home_players}
-    away_active: Set[int] = {p.id for p in away_players}
+    # TEST_MODE is a process-level constant: read it once into a local for the booking loop
+    debug = TEST_MODE
+
+    # Track which players are still on the pitch (lists for indexed picks and O(1) swap-pop removal)
+    home_active_list: List[int] = [p.id for p in home_players]
+    away_active_list: List[int] = [p.id for p in away_players]
     
     # Track bookings throughout the match
-    home_yellows = {}  # player_id -> count
-    away_yellows = {}  # player_id -> count
+    home_yellows = Counter()  # player_id -> count
+    away_yellows = Counter()  # player_id -> count
     
     # Store events with minute stamps
     bookings_with_minutes = []
     send_offs = []  # [{player_id, minute, reason}]
     
     # Simulate goals (simplified - just random for now)
-    home_goals = random.randint(0, 4)
-    away_goals = random.randint(0, 4)
+    home_goals, away_goals = _np_rng.integers(0, 5, size=2).tolist()
     
-    # Simulate bookings throughout 90 minutes
-    for minute in range(1, 91):
-        # Random chance of booking each minute (very low)
-        if random.random() < 0.02:  # 2% chance per minute
-            # Pick a random team
-            if random.choice([True, False]) and home_active:
-                # Home team booking
-                player_id = random.choice(list(home_active))
+    # Booking randomness drawn up front: one booking roll per minute, then
+    # [side, direct red, player pick] rolls only for the booked minutes
+    booking_minutes = (np.flatnonzero(_np_rng.random(90) < 0.02) + 1).tolist()  # 2% chance per minute
+    rolls = _np_rng.random((len(booking_minutes), 3)).tolist()
+
+    # Simulate bookings: only the (few) minutes where a booking fires
+    for minute, (side_roll, red_roll, pick_roll) in zip(booking_minutes, rolls):
+        # Nobody left to book: stop
+        if not home_active_list and not away_active_list:
+            break
+
+        # Pick a team (emptiness checked first; the side roll only matters when both sides have players)
+        if home_active_list and (not away_active_list or side_roll < 0.5):
+            # Home team booking
+            pick = int(pick_roll * len(home_active_list))
+            player_id = home_active_list[pick]
+            
+            # Chance of direct red vs yellow
+            if red_roll < 0.15:  # 15% chance of direct red
+                bookings_with_minutes.append({
+                    "player_id": player_id,
+                    "minute": minute,
+                    "type": "red"
+                })
+                send_offs.append({
+                    "player_id": player_id,
+                    "minute": minute,
+                    "reason": "direct_red"
+                })
+                swap_pop(home_active_list, pick)
+                if debug:
+                    print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) sent off for direct red!")
+                    
+            else:  # Yellow card
+                home_yellows[player_id] += 1
+                bookings_with_minutes.append({
+                    "player_id": player_id,
+                    "minute": minute,
+                    "type": "yellow"
+                })
                 
-                # Chance of direct red vs yellow
-                if random.random() < 0.15:  # 15% chance of direct red
+                # Check for second yellow = red
+                if home_yellows[player_id] >= 2:
                     bookings_with_minutes.append({
                         "player_id": player_id,
                         "minute": minute,
-                        "type": "red"
+                        "type": "second_yellow_red"
                     })
                     send_offs.append({
                         "player_id": player_id,
                         "minute": minute,
-                        "reason": "direct_red"
+                        "reason": "second_yellow"
                     })
-                    home_active.discard(player_id)  # Remove from active players
-                    if TEST_MODE:
-                        print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) sent off for direct red!")
+                    swap_pop(home_active_list, pick)
+                    if debug:
+                        print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) sent off for second yellow!")
                         
-                else:  # Yellow card
-                    home_yellows[player_id] = home_yellows.get(player_id, 0) + 1
-                    bookings_with_minutes.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "type": "yellow"
-                    })
+        elif away_active_list:
+            # Away team booking (same logic)
+            pick = int(pick_roll * len(away_active_list))
+            player_id = away_active_list[pick]
+            
+            if red_roll < 0.15:  # Direct red
+                bookings_with_minutes.append({
+                    "player_id": player_id,
+                    "minute": minute,
+                    "type": "red"
+                })
+                send_offs.append({
+                    "player_id": player_id,
+                    "minute": minute,
+                    "reason": "direct_red"
+                })
+                swap_pop(away_active_list, pick)
+                if debug:
+                    print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) sent off for direct red!")
                     
-                    # Check for second yellow = red
-                    if home_yellows[player_id] >= 2:
-                        bookings_with_minutes.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "type": "second_yellow_red"
-                        })
-                        send_offs.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "reason": "second_yellow"
-                        })
-                        home_active.discard(player_id)  # Remove from active players
-                        if TEST_MODE:
-                            print(f"   🟥 MINUTE {minute}: Player {player_id} (HOME) sent off for second yellow!")
-                            
-            elif away_active:
-                # Away team booking (same logic)
-                player_id = random.choice(list(away_active))
+            else:  # Yellow card
+                away_yellows[player_id] += 1
+                bookings_with_minutes.append({
+                    "player_id": player_id,
+                    "minute": minute,
+                    "type": "yellow"
+                })
                 
-                if random.random() < 0.15:  # Direct red
+                # Check for second yellow = red
+                if away_yellows[player_id] >= 2:
                     bookings_with_minutes.append({
                         "player_id": player_id,
                         "minute": minute,
-                        "type": "red"
+                        "type": "second_yellow_red"
                     })
                     send_offs.append({
                         "player_id": player_id,
                         "minute": minute,
-                        "reason": "direct_red"
-                    })
-                    away_active.discard(player_id)
-                    if TEST_MODE:
-                        print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) sent off for direct red!")
-                        
-                else:  # Yellow card
-                    away_yellows[player_id] = away_yellows.get(player_id, 0) + 1
-                    bookings_with_minutes.append({
-                        "player_id": player_id,
-                        "minute": minute,
-                        "type": "yellow"
+                        "reason": "second_yellow"
                     })
-                    
-                    # Check for second yellow = red
-                    if away_yellows[player_id] >= 2:
-                        bookings_with_minutes.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "type": "second_yellow_red"
-                        })
-                        send_offs.append({
-                            "player_id": player_id,
-                            "minute": minute,
-                            "reason": "second_yellow"
-                        })
-                        away_active.discard(player_id)
-                        if TEST_MODE:
-                            print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) sent off for second yellow!")
+                    swap_pop(away_active_list, pick)
+                    if debug:
+                        print(f"   🟥 MINUTE {minute}: Player {player_id} (AWAY) sent off for second yellow!")
     
     return {
         "home_goals": home_goals,
@@ -256,69 +288,64 @@ def simulate_minute_based_events(home_players: List[Player], away_players: List[
         "bookings_with_minutes": bookings_with_minutes,
         "send_offs": send_offs,
         "final_active_players": {
-            "home": list(home_active),
-            "away": list(away_active)
+            "home": home_active_list,
+            "away": away_active_list
         }
     }
 
 # ---------------------------------------------
-# Helper: create suspension AFTER match ends
+# Helper: create suspensions AFTER match ends
 # ---------------------------------------------
-def create_or_update_suspension_sync(session: Session, player_id: int, matches: int, reason: str):
+def create_or_update_suspensions_bulk_sync(
+    session: Session, entries: List[Tuple[int, int, str]], now: Optional[datetime] = None
+) -> None:
     """
-    Creates or updates a player's suspension.
-    If a Suspension exists, ADD to matches_remaining. Otherwise create a new one.
+    For each (player_id, matches, reason): create a new Suspension, or ADD
+    matches onto the existing one. Existing rows are fetched in ONE query;
+    does NOT commit (simulate_match commits once at the end).
+    Pass `now` to reuse the caller's clock read.
     """
-    existing = session.exec(select(Suspension).where(Suspension.player_id == player_id)).first()
-    if existing:
-        existing.matches_remaining = max(0, existing.matches_remaining) + max(0, matches)
-        existing.reason = reason
-        existing.updated_at = datetime.utcnow()
-        session.add(existing)
-    else:
-        sus = Suspension(
-            player_id=player_id,
-            reason=reason,
-            matches_remaining=max(0, matches)
-        )
-        session.add(sus)
-    session.commit()
+    if not entries:
+        return
+
+    existing_by_player = {
+        sus.player_id: sus
+        for sus in session.exec(
+            select(Suspension).where(Suspension.player_id.in_([player_id for player_id, _, _ in entries]))
+        ).all()
+    }
+
+    now = now or datetime.utcnow()
+    for player_id, matches, reason in entries:
+        existing = existing_by_player.get(player_id)
+        if existing:
+            existing.matches_remaining = max(0, existing.matches_remaining) + max(0, matches)
+            existing.reason = reason
+            existing.updated_at = now
+        else:
+            sus = Suspension(
+                player_id=player_id,
+                reason=reason,
+                matches_remaining=max(0, matches)
+            )
+            session.add(sus)
+            existing_by_player[player_id] = sus
 
 # ------------------------------------------------------------
 # Helper: decrement suspensions for both clubs after the match
 # ------------------------------------------------------------
-def decrement_suspensions_after_match_sync(session: Session, home_club_id: int, away_club_id: int, newly_suspended_players: Set[int]) -> None:
+def decrement_suspensions_after_match_sync(
+    session: Session, home_club_id: int, away_club_id: int,
+    newly_suspended_players: Set[int] = frozenset(), now: Optional[datetime] = None
+) -> None:
     """
     For all players in the two clubs with matches_remaining > 0,
-    decrement by 1 (never below 0).
+    decrement by 1 (never below 0), in ONE UPDATE. Does NOT commit.
     
     NEW: Skip players who got suspended in THIS match (newly_suspended_players)
     so their suspension countdown doesn't start until the NEXT match.
     """
-    suspensions = session.exec(
-        select(Suspension)
-        .join(Player, Player.id == Suspension.player_id)
-        .where(Player.club_id.in_([home_club_id, away_club_id]), Suspension.matches_remaining > 0)
-    ).all()
-
-    changed = False
-    for sus in suspensions:
-        # Skip players who got suspended in this same match
-        if sus.player_id in newly_suspended_players:
-            if TEST_MODE:
-                print(f"   ⏭️  Skipping suspension decrement for player {sus.player_id} (suspended this match)")
-            continue
-            
-        sus.matches_remaining = max(0, sus.matches_remaining - 1)
-        sus.updated_at = datetime.utcnow()
-        session.add(sus)
-        changed = True
-        
-        if TEST_MODE:
-            print(f"   ⏬ Player {sus.player_id} suspension decremented to {sus.matches_remaining} matches")
-
-    if changed:
-        session.commit()
+    session.execute(suspension_decrement_stmt(home_club_id, away_club_id, newly_suspended_players, now))
 
 @router.post("/simulate")
 def simulate_match(home_email: str, away_email: str, session: Session = Depends(get_session)):
@@ -331,48 +358,44 @@ def simulate_match(home_email: str, away_email: str, session: Session = Depends(
     # ---------------------------------------------
     injury_risk_debug = []
 
-    # 1️⃣ Fetch clubs
-    home_club = session.exec(select(Club).where(Club.manager_email == home_email)).first()
-    away_club = session.exec(select(Club).where(Club.manager_email == away_email)).first()
+    # TEST_MODE is a process-level constant: read it once into a local
+    debug = TEST_MODE
+
+    # One clock read per match: suspension updates and injury dates share it
+    now_utc = datetime.utcnow()
+    now_local = now_utc.replace(tzinfo=timezone.utc).astimezone(UTC_PLUS_2)
+
+    # 1️⃣ Fetch clubs (with stadiums joined in the same query)
+    clubs_by_email = {
+        club.manager_email: club
+        for club in session.exec(
+            select(Club)
+            .options(joinedload(Club.stadium))
+            .where(Club.manager_email.in_([home_email, away_email]))
+        ).all()
+    }
+    home_club = clubs_by_email.get(home_email)
+    away_club = clubs_by_email.get(away_email)
     if not home_club or not away_club:
         raise HTTPException(status_code=404, detail="One or both clubs not found.")
 
-    # 2️⃣ Fetch home stadium for pitch quality
-    stadium = session.exec(select(Stadium).where(Stadium.club_id == home_club.id)).first()
+    # 2️⃣ Home stadium for pitch quality (already loaded with the club)
+    stadium = home_club.stadium
     if not stadium:
         raise HTTPException(status_code=404, detail="Home stadium not found.")
     pitch_quality = stadium.pitch_quality
 
     # 3️⃣ Fetch players (including rehab-phase players)
-    home_players = session.exec(select(Player).where(Player.club_id == home_club.id)).all()
-    away_players = session.exec(select(Player).where(Player.club_id == away_club.id)).all()
+    players = session.exec(select(Player).where(Player.club_id.in_([home_club.id, away_club.id]))).all()
+    home_players = [p for p in players if p.club_id == home_club.id]
+    away_players = [p for p in players if p.club_id == away_club.id]
     if not home_players or not away_players:
         raise HTTPException(status_code=400, detail="One or both clubs have no players.")
 
-    # 4️⃣ Build stat dictionaries for goal simulation
-    expected_stats = ["pace", "passing", "defending", "stamina", "vision", "finishing"]
-
-    def get_average_stat(stat: str, players: list) -> float:
-        if not players:
-            return 0
-        player_ids = [p.id for p in players]
-        stat_records = session.exec(
-            select(PlayerStat).where(
-                PlayerStat.player_id.in_(player_ids),
-                PlayerStat.stat_name == stat
-            )
-        ).all()
-        if not stat_records:
-            return 0
-        return sum(s.value for s in stat_records) / len(stat_records)
-
-    home_stats = {stat: get_average_stat(stat, home_players) for stat in expected_stats}
-    away_stats = {stat: get_average_stat(stat, away_players) for stat in expected_stats}
-
     # =========================================
     # 🕐 NEW: Minute-based event simulation
     # =========================================
-    if TEST_MODE:
+    if debug:
         print(f"\n🏁 Starting match simulation: {home_club.name} vs {away_club.name}")
         print(f"   Initial squad sizes: Home={len(home_players)}, Away={len(away_players)}")
 
@@ -383,7 +406,7 @@ def simulate_match(home_email: str, away_email: str, session: Session = Depends(
     bookings_payload = match_events["bookings_with_minutes"]
     send_offs = match_events["send_offs"]
     
-    if TEST_MODE:
+    if debug:
         print(f"   Final score: {goals_home}-{goals_away}")
         print(f"   Total bookings: {len(bookings_payload)}")
         print(f"   Players sent off: {len(send_offs)}")
@@ -393,63 +416,93 @@ def simulate_match(home_email: str, away_email: str, session: Session = Depends(
     # =========================================
     newly_suspended_players = set()
     
-    # Process send-offs and create suspensions
+    # Process send-offs: collect (player_id, matches, reason), then upsert them in one go
+    # (every direct red's ban length drawn in one call)
+    suspension_entries = []
+    red_lengths = iter(_np_rng.integers(
+        RED_SUSPENSION_MIN, RED_SUSPENSION_MAX + 1,
+        size=sum(send_off["reason"] == "direct_red" for send_off in send_offs)
+    ).tolist())
     for send_off in send_offs:
         player_id = send_off["player_id"]
         reason = send_off["reason"]
         
         if reason == "second_yellow":
             suspension_length = TWO_YELLOWS_SUSPENSION
-            create_or_update_suspension_sync(session, player_id, suspension_length, "two_yellows")
+            suspension_entries.append((player_id, suspension_length, "two_yellows"))
             newly_suspended_players.add(player_id)
-            if TEST_MODE:
+            if debug:
                 print(f"   📋 Created {suspension_length}-match suspension for player {player_id} (two yellows)")
                 
         elif reason == "direct_red":
-            suspension_length = random.randint(RED_SUSPENSION_MIN, RED_SUSPENSION_MAX)
-            create_or_update_suspension_sync(session, player_id, suspension_length, "red_card")
+            suspension_length = next(red_lengths)
+            suspension_entries.append((player_id, suspension_length, "red_card"))
             newly_suspended_players.add(player_id)
-            if TEST_MODE:
+            if debug:
                 print(f"   📋 Created {suspension_length}-match suspension for player {player_id} (red card)")
 
+    create_or_update_suspensions_bulk_sync(session, suspension_entries, now=now_utc)
+
     # =========================================
     # 📉 Decrement existing suspensions (but skip this match's new ones)
     # =========================================
-    if TEST_MODE and newly_suspended_players:
+    if debug and newly_suspended_players:
         print(f"   🔄 Decrementing existing suspensions (skipping {len(newly_suspended_players)} new ones)")
     
-    decrement_suspensions_after_match_sync(session, home_club.id, away_club.id, newly_suspended_players)
+    decrement_suspensions_after_match_sync(
+        session, home_club.id, away_club.id, newly_suspended_players, now=now_utc
+    )
 
     # 6️⃣ Injury & Reinjury Risk Logic (only for players who weren't sent off)
-    all_players = home_players + away_players
+    n_total = len(home_players) + len(away_players)
     active_at_end = set(match_events["final_active_players"]["home"] + match_events["final_active_players"]["away"])
     
     base_risk = 0.05
-    tz = timezone(timedelta(hours=2))
+    today_utc = now_utc.date()  # Healed-window reference for every player
     injuries = []
+    new_injury_rows = []  # Inserted in one executemany after the loop
+    injured = []  # (player, active injury or None) for every player whose roll hit
+
+    # All injury rolls drawn up front from the module RNG (one per player)
+    injury_rolls = [_random() for _ in range(n_total)]
 
-    for player in all_players:
+    # Energy/proneness are still placeholders (100 / 1.0), so the base risk is
+    # the same for every player in this match: compute it once
+    energy = 100  # placeholder until fatigue system added
+    proneness = 1.0  # placeholder until hidden trait added
+    risk = calculate_injury_risk(base_risk, pitch_quality, energy, proneness)
+
+    # Injury history for everyone still on the pitch in one query:
+    # latest active injury (rehab check) + latest injury overall (recently healed check)
+    injury_rows = session.exec(
+        select(Injury)
+        .where(Injury.player_id.in_(active_at_end))
+        .order_by(Injury.start_date)
+    ).all() if active_at_end else []
+    active_injury_by_player = {}
+    last_injury_by_player = {}
+    for injury in injury_rows:
+        last_injury_by_player[injury.player_id] = injury
+        if injury.days_remaining > 0:
+            active_injury_by_player[injury.player_id] = injury
+
+    for player, injury_roll in zip(chain(home_players, away_players), injury_rolls):
         # Skip injury calculation for players who were sent off
         if player.id not in active_at_end:
-            if TEST_MODE:
+            if VERBOSE_INJURY_LOG:
                 print(f"   🚫 Skipping injury risk for sent-off player: {player.first_name} {player.last_name}")
             continue
             
-        energy = 100  # placeholder until fatigue system added
-        proneness = 1.0  # placeholder until hidden trait added
-
         # Check for active rehab injury
-        rehab_injury = session.exec(
-            select(Injury).where(Injury.player_id == player.id, Injury.days_remaining > 0)
-        ).first()
+        rehab_injury = active_injury_by_player.get(player.id)
 
-        risk = calculate_injury_risk(base_risk, pitch_quality, energy, proneness)
-        
         # Apply full reinjury risk multiplier system
-        multiplier = calculate_reinjury_risk_multiplier(player, session)
+        multiplier = calculate_reinjury_risk_multiplier(
+            player, session, prefetched=(rehab_injury, last_injury_by_player.get(player.id)), today=today_utc
+        )
         final_risk = risk * multiplier
         
-        if TEST_MODE:
+        if VERBOSE_INJURY_LOG:
             print(f"   🩺 Injury risk: {player.first_name} {player.last_name} - {final_risk:.2%} (base: {risk:.2%}, multiplier: {multiplier:.2f})")
 
         # Collect reason flags for debug
@@ -472,53 +525,55 @@ def simulate_match(home_email: str, away_email: str, session: Session = Depends(
             "reasons": reason_flags,
         })
 
-        # Roll for injury
-        if random.random() < final_risk:
-            injury_data = generate_injury()
-
-            if rehab_injury and rehab_injury.days_remaining <= rehab_injury.rehab_start:
-                # 🔁 Reinjury: overwrite current injury
-                rehab_injury.name = injury_data["name"]
-                rehab_injury.type = injury_data["type"]
-                rehab_injury.severity = injury_data["severity"]
-                rehab_injury.start_date = datetime.now(tz)
-                rehab_injury.days_total = injury_data["days_total"]
-                rehab_injury.rehab_start = injury_data["rehab_start"]
-                rehab_injury.rehab_xp_multiplier = injury_data["rehab_xp_multiplier"]
-                rehab_injury.fit_for_matches = False
-                rehab_injury.days_remaining = injury_data["days_total"]
-
-                if TEST_MODE:
-                    print(f"   🔁 Reinjury: {player.first_name} aggravated existing injury!")
-                reinjury_flag = True
-            else:
-                # Fresh injury
-                new_injury = Injury(
-                    player_id=player.id,
-                    name=injury_data["name"],
-                    type=injury_data["type"],
-                    severity=injury_data["severity"],
-                    start_date=datetime.now(tz),
-                    days_total=injury_data["days_total"],
-                    rehab_start=injury_data["rehab_start"],
-                    rehab_xp_multiplier=injury_data["rehab_xp_multiplier"],
-                    fit_for_matches=False,
-                    days_remaining=injury_data["days_total"]
-                )
-                session.add(new_injury)
-                reinjury_flag = False
-
-            injuries.append({
-                "player": f"{player.first_name} {player.last_name}",
+        # Roll for injury (details for everyone injured are drawn in one batch below)
+        if injury_roll < final_risk:
+            injured.append((player, rehab_injury))
+
+    for (player, rehab_injury), injury_data in zip(injured, generate_injuries(len(injured), rng=_rng)):
+        if rehab_injury and rehab_injury.days_remaining <= rehab_injury.rehab_start:
+            # 🔁 Reinjury: overwrite current injury
+            rehab_injury.name = injury_data["name"]
+            rehab_injury.type = injury_data["type"]
+            rehab_injury.severity = injury_data["severity"]
+            rehab_injury.start_date = now_local
+            rehab_injury.days_total = injury_data["days_total"]
+            rehab_injury.rehab_start = injury_data["rehab_start"]
+            rehab_injury.rehab_xp_multiplier = injury_data["rehab_xp_multiplier"]
+            rehab_injury.fit_for_matches = False
+            rehab_injury.days_remaining = injury_data["days_total"]
+
+            if debug:
+                print(f"   🔁 Reinjury: {player.first_name} aggravated existing injury!")
+            reinjury_flag = True
+        else:
+            # Fresh injury (row for the bulk insert below)
+            new_injury_rows.append({
                 "player_id": player.id,
-                "reinjury": reinjury_flag,
-                **injury_data
+                "name": injury_data["name"],
+                "type": injury_data["type"],
+                "severity": injury_data["severity"],
+                "start_date": now_local,
+                "days_total": injury_data["days_total"],
+                "rehab_start": injury_data["rehab_start"],
+                "rehab_xp_multiplier": injury_data["rehab_xp_multiplier"],
+                "fit_for_matches": False,
+                "days_remaining": injury_data["days_total"]
             })
+            reinjury_flag = False
 
-            if TEST_MODE:
-                print(f"   🩺 New injury: {player.first_name} {player.last_name} - {injury_data['name']} ({injury_data['severity']})")
+        injuries.append({
+            "player": f"{player.first_name} {player.last_name}",
+            "player_id": player.id,
+            "reinjury": reinjury_flag,
+            **injury_data
+        })
 
-    session.commit()
+        if debug:
+            print(f"   🩺 New injury: {player.first_name} {player.last_name} - {injury_data['name']} ({injury_data['severity']})")
+
+    # All fresh injuries in one INSERT; reinjury edits are flushed with the commit below
+    if new_injury_rows:
+        session.execute(Injury.__table__.insert(), new_injury_rows)
 
     # 🧠 Energy drain after match
     def drain_energy(players: List[Player], minutes_played: int = 90, intensity_factor: float = 1.0):
@@ -528,7 +583,7 @@ def simulate_match(home_email: str, away_email: str, session: Session = Depends(
             player.energy = max(0, player.energy - int(base_energy_loss))
             session.add(player)
 
-    # Apply energy drain to both teams
+    # Apply energy drain to both teams, then commit injuries + energy together
     drain_energy(home_players)
     drain_energy(away_players)
     session.commit()
@@ -536,10 +591,11 @@ def simulate_match(home_email: str, away_email: str, session: Session = Depends(
     # ✅ Calculate summaries
     reinjuries = sum(1 for inj in injuries if inj["reinjury"])
     new_injuries = len(injuries) - reinjuries
-    home_injuries = [inj for inj in injuries if any(p.id == inj["player_id"] for p in home_players)]
-    away_injuries = [inj for inj in injuries if any(p.id == inj["player_id"] for p in away_players)]
+    home_ids = {p.id for p in home_players}
+    home_injuries = [inj for inj in injuries if inj["player_id"] in home_ids]
+    away_injuries = [inj for inj in injuries if inj["player_id"] not in home_ids]
     
-    if TEST_MODE:
+    if debug:
         print(f"\n📊 Match Summary:")
         print(f"   Score: {goals_home}-{goals_away}")
         print(f"   Injuries: {len(injuries)} total ({new_injuries} new, {reinjuries} reinjuries)")
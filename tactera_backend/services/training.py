@@ -1,10 +1,10 @@
 # training.py
 
 import random
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Optional
 from tactera_backend.models.club_model import Club # Club model
 from tactera_backend.models.training_model import TrainingGround  # Core model
-from tactera_backend.models.player_stat_model import PlayerStat  # Stat model lives in separate file
 from tactera_backend.models.player_model import Player  # Player model lives in separate file
 from fastapi import APIRouter, HTTPException, Depends
 from sqlmodel import Session, select
@@ -12,6 +12,12 @@ from datetime import date
 from tactera_backend.core.database import get_session
 from tactera_backend.models.club_model import Club
 from tactera_backend.core.training_intensity import get_xp_multiplier, calculate_energy_drain
+from tactera_backend.core.config import RANDOM_SEED
+
+# Module-level RNGs (seedable via TACTERA_RANDOM_SEED for reproducible runs)
+_rng = random.Random(RANDOM_SEED)
+_uniform = _rng.uniform
+_np_rng = np.random.default_rng(RANDOM_SEED)
 
 
 
@@ -53,59 +59,114 @@ DRILLS = [
     },
 ]
 
+# Fixed stat schema for squad-wide (NumPy) XP matrices: column i = STAT_ORDER[i]
+STAT_ORDER = (
+    "passing", "finishing", "dribbling", "tackling", "first_touch",
+    "vision", "positioning", "pace", "stamina", "strength"
+)
+STAT_IDX = {stat: i for i, stat in enumerate(STAT_ORDER)}
+
+# Drill name -> column indices of its affected stats (kept out of DRILLS,
+# which is returned as JSON by the drills endpoint)
+DRILL_STAT_IDX = {
+    drill["name"]: np.array([STAT_IDX[stat] for stat in drill["affected_stats"]], dtype=np.int8)
+    for drill in DRILLS
+}
+
+# Lowercased name -> drill, built once at import
+_DRILL_INDEX = {drill["name"].lower(): drill for drill in DRILLS}
+
 def get_drill_by_name(name: str) -> Dict:
     """Fetch a drill definition by its name (case-insensitive)"""
-    for drill in DRILLS:
-        if drill["name"].lower() == name.lower():
-            return drill
-    raise ValueError(f"Drill '{name}' not found.")
+    drill = _DRILL_INDEX.get(name.lower())
+    if drill is None:
+        raise ValueError(f"Drill '{name}' not found.")
+    return drill
 
 
 # === XP CALCULATION ===
 
+# Consistency tiers: (minimum consistency, P(bad session), P(bad or average session))
+# Checked top-down; the first tier whose floor the player reaches applies.
+CONSISTENCY_TIERS = (
+    (90, 0.05, 0.50),
+    (70, 0.10, 0.70),
+    (50, 0.15, 0.85),
+    (30, 0.25, 0.90),
+    (0, 0.40, 0.90),
+)
+
+# Variance multiplier ranges for bad / average / good sessions
+BAD_VARIANCE = (0.6, 0.9)
+AVERAGE_VARIANCE = (0.9, 1.1)
+GOOD_VARIANCE = (1.1, 1.3)
+
+
 def get_consistency_variance(consistency: int) -> float:
     """Return a multiplier based on consistency using a probabilistic model"""
-    roll = random.uniform(0, 1)
-
-    if consistency >= 90:
-        if roll < 0.05:
-            return random.uniform(0.6, 0.9)   # Bad
-        elif roll < 0.50:
-            return random.uniform(0.9, 1.1)   # Average
-        else:
-            return random.uniform(1.1, 1.3)   # Good
-
-    elif consistency >= 70:
-        if roll < 0.10:
-            return random.uniform(0.6, 0.9)
-        elif roll < 0.70:
-            return random.uniform(0.9, 1.1)
-        else:
-            return random.uniform(1.1, 1.3)
-
-    elif consistency >= 50:
-        if roll < 0.15:
-            return random.uniform(0.6, 0.9)
-        elif roll < 0.85:
-            return random.uniform(0.9, 1.1)
-        else:
-            return random.uniform(1.1, 1.3)
-
-    elif consistency >= 30:
-        if roll < 0.25:
-            return random.uniform(0.6, 0.9)
-        elif roll < 0.90:
-            return random.uniform(0.9, 1.1)
-        else:
-            return random.uniform(1.1, 1.3)
+    for floor, bad_p, average_p in CONSISTENCY_TIERS:
+        if consistency >= floor:
+            break
 
-    else:
-        if roll < 0.40:
-            return random.uniform(0.6, 0.9)
-        elif roll < 0.90:
-            return random.uniform(0.9, 1.1)
-        else:
-            return random.uniform(1.1, 1.3)
+    roll = _uniform(0, 1)
+    if roll < bad_p:
+        return _uniform(*BAD_VARIANCE)
+    if roll < average_p:
+        return _uniform(*AVERAGE_VARIANCE)
+    return _uniform(*GOOD_VARIANCE)
+
+
+# Ambition tiers: (minimum ambition, XP factor), checked top-down
+AMBITION_TIERS = (
+    (95, 1.2),
+    (90, 1.1),
+    (80, 1.0),
+    (60, 0.9),
+    (40, 0.70),
+)
+DEFAULT_AMBITION_FACTOR = 0.6
+
+
+def _ambition_factor_from_tiers(ambition: int) -> float:
+    for floor, factor in AMBITION_TIERS:
+        if ambition >= floor:
+            return factor
+    return DEFAULT_AMBITION_FACTOR
+
+
+# Precomputed factor for every ambition 0–100: lookup is a single index
+# (a single gather for squad arrays) instead of walking the tiers.
+_AMB_FACTOR = np.array([_ambition_factor_from_tiers(a) for a in range(101)])
+
+
+def get_ambition_factor(ambition: int) -> float:
+    """Return the XP factor for a player's ambition."""
+    if 0 <= ambition <= 100:
+        return float(_AMB_FACTOR[ambition])
+    return _ambition_factor_from_tiers(ambition)
+
+
+# potential ** 1.15 for every potential 0–200 (potential is fixed per player,
+# so the pow is computed once at import instead of every training session)
+MAX_POTENTIAL = 200
+_POTENTIAL_FACTOR = np.arange(MAX_POTENTIAL + 1, dtype=np.float64) ** 1.15
+
+
+def get_potential_factor(potential: int) -> float:
+    """Return potential ** 1.15, from the lookup table when in range."""
+    if 0 <= potential <= MAX_POTENTIAL:
+        return float(_POTENTIAL_FACTOR[potential])
+    return potential ** 1.15
+
+
+def training_xp_core(potential_factor, ambition_factor, training_ground_boost, variance):
+    """
+    Pure numeric XP formula shared by the scalar and squad (NumPy) paths.
+    Works on plain floats or arrays; all randomness is drawn by the caller.
+    `potential_factor` is potential ** 1.15 (see get_potential_factor).
+    """
+    tg_factor = (1 + training_ground_boost / 100)
+    return potential_factor * ambition_factor * tg_factor * variance
 
 
 def calculate_training_xp(
@@ -120,35 +181,70 @@ def calculate_training_xp(
 
     XP = potential × ambition modifier × training ground boost × consistency variance
     """
-    potential_factor = potential
-    if ambition >= 95:
-        ambition_factor = 1.2
-    elif ambition >= 90:
-        ambition_factor = 1.1
-    elif ambition >= 80:
-        ambition_factor = 1.0
-    elif ambition >= 60:
-        ambition_factor = 0.9
-    elif ambition >= 40:
-        ambition_factor = 0.70
-    else:
-        ambition_factor = 0.6
-    tg_factor = (1 + training_ground_boost / 100)
+    ambition_factor = get_ambition_factor(ambition)
     variance = get_consistency_variance(consistency)
-
-    xp = (potential ** 1.15) * ambition_factor * tg_factor * variance
-    return round(xp, 2)
-
-def split_xp_among_stats(total_xp: float, stat_list: List[str]) -> Dict[str, float]:
+    potential_factor = get_potential_factor(potential)
+    return round(training_xp_core(potential_factor, ambition_factor, training_ground_boost, variance), 2)
+
+def get_consistency_variance_array(consistency: np.ndarray) -> np.ndarray:
+    """Vectorized get_consistency_variance: one multiplier per player."""
+    consistency = np.asarray(consistency)
+    tier_conditions = [consistency >= floor for floor, _, _ in CONSISTENCY_TIERS]
+    bad_p = np.select(tier_conditions, [t[1] for t in CONSISTENCY_TIERS], default=CONSISTENCY_TIERS[-1][1])
+    average_p = np.select(tier_conditions, [t[2] for t in CONSISTENCY_TIERS], default=CONSISTENCY_TIERS[-1][2])
+
+    roll = _np_rng.random(consistency.shape)
+    low = np.where(roll < bad_p, BAD_VARIANCE[0], np.where(roll < average_p, AVERAGE_VARIANCE[0], GOOD_VARIANCE[0]))
+    high = np.where(roll < bad_p, BAD_VARIANCE[1], np.where(roll < average_p, AVERAGE_VARIANCE[1], GOOD_VARIANCE[1]))
+    return _np_rng.uniform(low, high)
+
+
+def calculate_squad_training_xp(
+    potentials: List[int],
+    ambitions: List[int],
+    consistencies: List[int],
+    training_ground_boost: int
+) -> np.ndarray:
+    """
+    Vectorized calculate_training_xp for a whole squad in one pass.
+    Same formula, returns one rounded XP total per player.
+    """
+    potential = np.asarray(potentials)
+    potential_factor = _POTENTIAL_FACTOR[np.clip(potential, 0, MAX_POTENTIAL)]
+    out_of_range = (potential < 0) | (potential > MAX_POTENTIAL)
+    if out_of_range.any():
+        potential_factor[out_of_range] = potential[out_of_range].astype(np.float64) ** 1.15
+    ambition_factor = _AMB_FACTOR[np.clip(np.asarray(ambitions), 0, 100)]
+    variance = get_consistency_variance_array(consistencies)
+    return np.round(training_xp_core(potential_factor, ambition_factor, training_ground_boost, variance), 2)
+
+def draw_squad_stat_weights(n_players: int, drill: Dict) -> np.ndarray:
+    """
+    Draw the ±20% split weights for a whole squad in one call.
+    Returns an (n_players, len(STAT_ORDER)) matrix; stats the drill does not
+    affect are 0.
+    """
+    weights = np.zeros((n_players, len(STAT_ORDER)))
+    idx = DRILL_STAT_IDX[drill["name"]]
+    weights[:, idx] = _np_rng.uniform(0.8, 1.2, size=(n_players, len(idx)))
+    return weights
+
+def split_xp_among_stats(
+    total_xp: float,
+    stat_list: List[str],
+    weights: Optional[List[float]] = None
+) -> Dict[str, float]:
     """
     Split an already-computed TOTAL XP across the given stats using weighted variation.
     This function must NOT depend on intensity or base_xp. It only divides total_xp.
+    Pass `weights` (aligned with stat_list) to reuse pre-drawn squad weights.
     """
     if not stat_list:
         return {}
 
     # Random weights per stat (±20% effect)
-    weights = [random.uniform(0.8, 1.2) for _ in stat_list]
+    if weights is None:
+        weights = [_uniform(0.8, 1.2) for _ in stat_list]
     weight_sum = sum(weights) if weights else 1.0
 
     # Proportional allocation
@@ -175,20 +271,27 @@ router = APIRouter()
 
 # --- INJURY-AWARE TRAINING HELPER ---
 
-from tactera_backend.models.injury_model import Injury  # ✅ Needed to check injuries
-
-def apply_training_with_injury_check(player: Player, drill: Dict, session: Session) -> Dict:
+def apply_training_with_injury_check(
+    player: Player,
+    drill: Dict,
+    session: Session,
+    training_ground: Optional[TrainingGround] = None,
+    base_xp: Optional[float] = None,
+    stat_weights: Optional[np.ndarray] = None
+) -> Dict:
     """
     Applies training XP to a player, respecting injury and rehab status.
     - Fully injured players: skipped.
     - Rehab-phase players: forced to light training XP.
     - Healthy players: normal training.
-    Returns a structured result dict.
+    Pass `training_ground` when training a whole squad so it is fetched once,
+    not once per player, and `base_xp` when the squad's XP was already
+    computed with calculate_squad_training_xp, plus `stat_weights` (the
+    player's row from draw_squad_stat_weights). Does not commit; the caller
+    commits once after the batch. Returns a structured result dict.
     """
-    # ✅ 1. Check if player has an active injury
-    active_injury = session.exec(
-        select(Injury).where(Injury.player_id == player.id).order_by(Injury.start_date.desc())
-    ).first()
+    # ✅ 1. Check if player has an active injury (latest one; uses eager-loaded injuries if present)
+    active_injury = max(player.injuries, key=lambda injury: injury.start_date, default=None)
 
     if active_injury:
     # Phase 1: Fully out (cannot train at all)
@@ -211,17 +314,22 @@ def apply_training_with_injury_check(player: Player, drill: Dict, session: Sessi
         rehab_penalty = 1.0
 
     # ✅ 2. Calculate XP
-    tg = session.exec(
-        select(TrainingGround).where(TrainingGround.id == player.club.trainingground_id)
-    ).first()
+    tg = training_ground
+    if tg is None:
+        tg = session.exec(
+            select(TrainingGround).where(TrainingGround.id == player.club.trainingground_id)
+        ).first()
     tg_boost = tg.xp_boost if tg else 100
 
-    total_xp = calculate_training_xp(
-        potential=player.potential,
-        ambition=player.ambition,
-        consistency=player.consistency,
-        training_ground_boost=tg_boost
-    )
+    if base_xp is not None:
+        total_xp = base_xp
+    else:
+        total_xp = calculate_training_xp(
+            potential=player.potential,
+            ambition=player.ambition,
+            consistency=player.consistency,
+            training_ground_boost=tg_boost
+        )
 
     # ✅ 3. Apply rehab penalty if needed
     total_xp *= rehab_penalty
@@ -250,15 +358,18 @@ def apply_training_with_injury_check(player: Player, drill: Dict, session: Sessi
 
 
     # ✅ 4. Split XP across stats
-    xp_split = split_xp_among_stats(total_xp, drill["affected_stats"])
+    weights = None
+    if stat_weights is not None:
+        weights = stat_weights[DRILL_STAT_IDX[drill["name"]]].tolist()
+    xp_split = split_xp_among_stats(total_xp, drill["affected_stats"], weights)
 
     # ✅ 5. Update player stats
     updated_stats = []
-    for stat in session.exec(select(PlayerStat).where(PlayerStat.player_id == player.id)).all():
+    for stat in player.stats:  # Eager-loaded by train_club via selectinload
         if stat.stat_name in xp_split:
             stat.xp += xp_split[stat.stat_name]
             updated_stats.append({"stat": stat.stat_name, "xp_gained": xp_split[stat.stat_name]})
-    session.commit()
+    # No commit here: the caller commits once for the whole squad
 
     return {
         "player": f"{player.first_name} {player.last_name}",
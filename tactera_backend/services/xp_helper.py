@@ -1,80 +1,119 @@
+import bisect
+from typing import List, Tuple
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 from tactera_backend.models.stat_level_requirement_model import StatLevelRequirement
-from tactera_backend.models.player_model import Player
+from tactera_backend.models.player_stat_model import PlayerStat
+
+# In-memory copy of the statlevelrequirement table (static reference data).
+# _xp_keys is sorted ascending; _levels[i] is the highest level reachable
+# with _xp_keys[i] XP, so a lookup is a single bisect instead of a query.
+_xp_keys: List[int] = []
+_levels: List[int] = []
+
+
+def _load_level_table(session: Session) -> None:
+    """Load the level requirements once per process."""
+    global _xp_keys, _levels
+    rows = session.exec(
+        select(StatLevelRequirement.xp_required, StatLevelRequirement.level)
+        .order_by(StatLevelRequirement.xp_required)
+    ).all()
+
+    xp_keys, levels, best = [], [], 0
+    for xp_required, level in rows:
+        best = max(best, level)
+        xp_keys.append(xp_required)
+        levels.append(best)
+    _xp_keys, _levels = xp_keys, levels
+
+
+def invalidate_level_table() -> None:
+    """Drop the cached level table (call after changing XP requirements)."""
+    global _xp_keys, _levels
+    _xp_keys, _levels = [], []
+
 
 def calculate_level_from_xp(stat_xp: int, session: Session) -> int:
     """
     Takes total XP for a stat and returns the corresponding level
     based on the statlevelrequirement table.
     """
-    statement = (
-        select(StatLevelRequirement)
-        .where(StatLevelRequirement.xp_required <= stat_xp)
-        .order_by(StatLevelRequirement.level.desc())
-        .limit(1)
-    )
-    result = session.exec(statement).first()
-    return result.level if result else 1
-
-def add_xp_to_stat(player_id: int, stat_name: str, xp_amount: int, session: Session):
-    from tactera_backend.models.player_model import Player  # Local import to avoid circular issues
-
-    # Load the player
-    player = session.get(Player, player_id)
-    if not player:
-        raise ValueError("Player not found")
-
-    # Determine the XP field name (e.g., 'pace_xp')
-    xp_field = f"{stat_name}_xp"
-
-    if not hasattr(player, xp_field):
-        raise ValueError(f"Stat '{stat_name}' is invalid")
-
-    # Add XP
-    current_xp = getattr(player, xp_field)
-    new_xp = current_xp + xp_amount
-    setattr(player, xp_field, new_xp)
-
-    # Commit changes
-    session.add(player)
-    session.commit()
-
-    # Return new level
-    return calculate_level_from_xp(new_xp, session)
+    if not _xp_keys:
+        _load_level_table(session)
+
+    idx = bisect.bisect_right(_xp_keys, stat_xp) - 1
+    return _levels[idx] if idx >= 0 else 1
+
+def add_xp_to_stats_bulk(updates: List[Tuple[int, str, int]], session: Session) -> List[int]:
+    """
+    Adds XP to many (player, stat) pairs, stored as PlayerStat rows
+    keyed by (player_id, stat_name).
+
+    Current totals are read in ONE query (every pair is validated before
+    anything changes), then all increments go through Core as one executemany
+    (UPDATE playerstat SET xp = xp + :d WHERE player_id = :pid AND stat_name = :stat)
+    instead of loading and writing each row through the ORM. PlayerStat
+    objects already loaded in this session are not refreshed.
+
+    Does NOT commit: the caller commits once after the whole batch.
 
-def add_xp_to_stat(player_id: int, stat_name: str, xp_amount: int, session):
+    Parameters:
+    - updates: list of (player_id, stat_name, xp_amount) tuples
+    - session: Database session (passed in from the route)
+
+    Returns the new XP totals, in the same order as `updates`.
+    """
+    table = PlayerStat.__table__
+    player_ids = {player_id for player_id, _, _ in updates}
+    stat_names = {stat_name for _, stat_name, _ in updates}
+    totals = {
+        (player_id, stat_name): xp
+        for player_id, stat_name, xp in session.execute(
+            select(table.c.player_id, table.c.stat_name, table.c.xp).where(
+                table.c.player_id.in_(player_ids),
+                table.c.stat_name.in_(stat_names)
+            )
+        ).all()
+    }
+
+    for player_id, stat_name, _ in updates:
+        if (player_id, stat_name) not in totals:
+            raise ValueError(f"Stat '{stat_name}' not found for player with ID {player_id}.")
+
+    new_totals = []
+    for player_id, stat_name, xp_amount in updates:
+        totals[(player_id, stat_name)] += xp_amount
+        new_totals.append(totals[(player_id, stat_name)])
+
+    if updates:
+        session.execute(
+            table.update()
+            .where(table.c.player_id == bindparam("pid"), table.c.stat_name == bindparam("stat"))
+            .values(xp=table.c.xp + bindparam("d")),
+            [
+                {"pid": player_id, "stat": stat_name, "d": xp_amount}
+                for player_id, stat_name, xp_amount in updates
+            ]
+        )
+
+    return new_totals
+
+def add_xp_to_stat(player_id: int, stat_name: str, xp_amount: int, session, commit: bool = True):
     """
-    Adds XP to a player's stat (e.g., 'pace', 'passing') by updating the corresponding *_xp field.
+    Adds XP to a player's stat (e.g., 'pace', 'passing') by updating its PlayerStat row.
+    Thin wrapper around add_xp_to_stats_bulk for a single update.
+    Returns the stat's new level. Commits by default; pass commit=False to
+    leave the write in the caller's transaction.
 
     Parameters:
     - player_id: ID of the player we want to update
     - stat_name: Name of the stat (like 'pace', 'passing', etc.)
     - xp_amount: How much XP to add
     - session: Database session (passed in from the route)
+    - commit: Commit after the update (False when part of a larger batch)
     """
-
-    # Map stat names to the actual column names in the database
-    stat_field_name = f"{stat_name}_xp"  # e.g., 'pace' → 'pace_xp'
-
-    # Get the player from the database
-    player = session.get(Player, player_id)
-
-    # If the player doesn't exist, return an error
-    if not player:
-        raise ValueError(f"Player with ID {player_id} not found.")
-
-    # Check if the player actually has this stat field (like 'pace_xp')
-    if not hasattr(player, stat_field_name):
-        raise ValueError(f"Stat '{stat_name}' is not valid.")
-
-    # Get the current XP value for the stat
-    current_xp = getattr(player, stat_field_name)
-
-    # Add the new XP amount
-    new_xp = current_xp + xp_amount
-
-    # Update the stat XP on the player
-    setattr(player, stat_field_name, new_xp)
-
-    # Save the change to the database
-    session.commit()
+    new_xp = add_xp_to_stats_bulk([(player_id, stat_name, xp_amount)], session)[0]
+    if commit:
+        session.commit()
+    return calculate_level_from_xp(new_xp, session)